@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import dataclasses
 import json
 import logging
 import os
@@ -162,7 +163,7 @@ class TradingGreen(GreenAgent):
             summary_text = "\n".join(lines)
 
             perf_payload = {
-                k: v.__dict__ for k, v in performance.items() if hasattr(v, "__dict__") and hasattr(v, "total_return_pct")
+                k: dataclasses.asdict(v) for k, v in performance.items() if hasattr(v, "total_return_pct")
             }
             if judge_text:
                 perf_payload["_judge_text"] = judge_text
@@ -3,10 +3,15 @@ State management for blockchain testing environment
 Handles setting up initial state and verifying end state
 """
 
-from typing import Dict, Any
-from web3 import Web3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 from .web3_client import BlockchainClient
 
+# Tokens tracked by state setup/inspection; tuples so the sequences are
+# built once at import instead of per call
+_TOKEN_BALANCE_KEYS = ("USDC_balance", "DAI_balance", "WETH_balance")
+_TRACKED_TOKENS = ("USDC", "DAI", "WETH")
+
 
 class StateManager:
     """Manages blockchain state for testing"""
@@ -14,7 +19,19 @@ class StateManager:
     def __init__(self, client: BlockchainClient):
         self.client = client
         self.w3 = client.w3
-        
+
+        # Lazily created pool for concurrent balance reads
+        self._balance_executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_balance_executor(self) -> ThreadPoolExecutor:
+        if self._balance_executor is None:
+            # One worker per tracked balance (ETH + tokens)
+            self._balance_executor = ThreadPoolExecutor(
+                max_workers=1 + len(_TRACKED_TOKENS),
+                thread_name_prefix="state-balance",
+            )
+        return self._balance_executor
+
     def setup_initial_state(self, state_config: Dict[str, Any]) -> bool:
         """
         Setup initial blockchain state for a test
@@ -39,7 +56,7 @@ class StateManager:
                     self.client.set_eth_balance(account, target_balance)
                     
             # Fund account with ERC20 tokens if needed
-            for token_key in ["USDC_balance", "DAI_balance", "WETH_balance"]:
+            for token_key in _TOKEN_BALANCE_KEYS:
                 if token_key in state_config:
                     token_name = token_key.replace("_balance", "")
                     amount = state_config[token_key]
@@ -62,15 +79,20 @@ class StateManager:
                 "DAI_balance": 2000
             }
         """
-        state = {
-            "ETH_balance": self.client.get_balance(account)
+        # The ETH read and each token read are independent eth_call /
+        # eth_getBalance round-trips; issuing them together makes the
+        # snapshot cost one RPC latency instead of four in sequence
+        pool = self._get_balance_executor()
+        eth_future = pool.submit(self.client.get_balance, account)
+        token_futures = {
+            token_name: pool.submit(self.client.get_token_balance_human, token_name, account)
+            for token_name in _TRACKED_TOKENS
         }
-        
-        # Get token balances using the consolidated method
-        for token_name in ["USDC", "DAI", "WETH"]:
-            balance = self.client.get_token_balance_human(token_name, account)
-            state[f"{token_name}_balance"] = balance
-                
+
+        state = {"ETH_balance": eth_future.result()}
+        for token_name, future in token_futures.items():
+            state[f"{token_name}_balance"] = future.result()
+
         return state
     
     def verify_end_state(self, account: str, expected_state: Dict[str, Any], tolerance: float = 0.01) -> Dict[str, Any]:
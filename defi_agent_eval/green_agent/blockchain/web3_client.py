@@ -4,21 +4,97 @@ Handles connection to Anvil local fork
 """
 
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
+from eth_abi import encode as abi_encode
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional
 import json
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 4-byte selector for transfer(address,uint256); never changes
+_TRANSFER_SELECTOR = Web3.keccak(text="transfer(address,uint256)")[:4]
+
+# Minimal ERC20 ABI; a constant so every contract lookup shares the
+# same list instead of rebuilding the nested dicts per call
+_ERC20_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function"
+    },
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "_to", "type": "address"},
+            {"name": "_value", "type": "uint256"}
+        ],
+        "name": "transfer",
+        "outputs": [{"name": "", "type": "bool"}],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "type": "function"
+    }
+]
+
+# Known whale addresses for major tokens (mainnet-fork testing only)
+_WHALE_BY_TOKEN = {
+    "USDC": "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503",
+    "DAI": "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503",
+    "WETH": "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503",
+}
+
+
+def wait_for_receipt_ws(ws_w3: Web3, tx_hash, timeout: int = 120):
+    """
+    Wait for a transaction receipt by watching new blocks over WebSocket.
+
+    wait_for_transaction_receipt polls eth_getTransactionReceipt over HTTP
+    every ~0.1s — dozens of round-trips per tx against a real node. Here we
+    watch a 'latest' block filter instead and look the receipt up once per
+    new block, so RPC traffic scales with block time, not poll interval.
+    """
+    deadline = time.time() + timeout
+    block_filter = ws_w3.eth.filter('latest')
+    try:
+        while True:
+            try:
+                return ws_w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            if time.time() > deadline:
+                raise TimeoutError(f"Receipt for {tx_hash} not found within {timeout}s")
+            # Block until a new head arrives before re-checking
+            while not block_filter.get_new_entries():
+                if time.time() > deadline:
+                    raise TimeoutError(f"Receipt for {tx_hash} not found within {timeout}s")
+                time.sleep(0.2)
+    finally:
+        ws_w3.eth.uninstall_filter(block_filter.filter_id)
+
 
 class BlockchainClient:
     """Manages Web3 connection to local Anvil fork"""
     
-    def __init__(self, rpc_url: Optional[str] = None):
+    def __init__(self, rpc_url: Optional[str] = None, ws_url: Optional[str] = None):
         self.rpc_url = rpc_url or os.getenv("ANVIL_RPC_URL", "http://127.0.0.1:8545")
         self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+
+        # Optional WebSocket endpoint for push-style receipt waits
+        self.ws_url = ws_url or os.getenv("ANVIL_WS_URL")
+        self._ws_w3: Optional[Web3] = None
         
         # Load configuration
         config_path = os.path.join(os.path.dirname(__file__), "../../configs/local_fork.json")
@@ -27,7 +103,44 @@ class BlockchainClient:
         
         # Test accounts
         self.accounts = self._load_accounts()
-        
+
+        # Fetched lazily on first use; the chain never changes per client
+        self._chain_id: Optional[int] = None
+
+        # Static per-token pieces of a transfer tx, built once per token
+        self._transfer_templates: Dict[str, dict] = {}
+
+        # Lazily created pool for background receipt confirmation
+        self._confirm_executor: Optional[ThreadPoolExecutor] = None
+
+    def confirm_in_background(self, tx_hash, timeout: int = 120) -> Future:
+        """
+        Wait for a receipt off the critical path.
+
+        Returns a Future resolving to the receipt, so callers can report the
+        tx hash optimistically and aggregate confirmations later.
+        """
+        if self._confirm_executor is None:
+            self._confirm_executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="tx-confirm"
+            )
+        return self._confirm_executor.submit(self.wait_for_receipt, tx_hash, timeout)
+
+    def wait_for_receipt(self, tx_hash, timeout: int = 120):
+        """Wait for a receipt, preferring the WebSocket path when configured"""
+        if self.ws_url:
+            if self._ws_w3 is None:
+                self._ws_w3 = Web3(Web3.WebsocketProvider(self.ws_url))
+            return wait_for_receipt_ws(self._ws_w3, tx_hash, timeout=timeout)
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
+    @property
+    def chain_id(self) -> int:
+        """Chain id, fetched once over RPC and cached"""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
     def _load_accounts(self) -> Dict[str, str]:
         """Load test accounts from Anvil default accounts"""
         # Anvil default accounts (first 3)
@@ -73,50 +186,102 @@ class BlockchainClient:
         decimals = self._get_token_decimals(token_name)
         return balance_wei / (10 ** decimals)
     
-    def transfer_erc20(self, token_name: str, from_account: str, to_account: str, 
+    def submit_erc20_transfer(self, token_name: str, from_account: str, to_account: str,
+                              amount: float, private_key: str, nonce: Optional[int] = None) -> str:
+        """
+        Build, sign and broadcast an ERC20 transfer WITHOUT waiting for the receipt.
+
+        Returns the transaction hash immediately so callers can batch
+        several transfers into the same block (pass explicit incrementing
+        nonces) and poll the receipts in one go afterwards.
+        """
+        template = self._transfer_template(token_name)
+        amount_wei = int(amount * (10 ** template['decimals']))
+
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_account))
+
+        # Splice recipient/amount into the cached template instead of
+        # rebuilding the contract object and re-encoding the selector
+        tx = {
+            'from': Web3.to_checksum_address(from_account),
+            'to': template['to'],
+            'value': 0,
+            'gas': template['gas'],
+            'gasPrice': self.w3.eth.gas_price,
+            'nonce': nonce,
+            'chainId': template['chainId'],
+            'data': _TRANSFER_SELECTOR + abi_encode(
+                ['address', 'uint256'],
+                [Web3.to_checksum_address(to_account), amount_wei]
+            )
+        }
+
+        # Sign and send transaction
+        account = Account.from_key(private_key)
+        signed_tx = account.sign_transaction(tx)
+        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        return tx_hash.hex()
+
+    def _transfer_template(self, token_name: str) -> dict:
+        """Static transfer-tx fields for a token, built once and reused"""
+        template = self._transfer_templates.get(token_name)
+        if template is None:
+            token_address = self.get_contract_address(token_name)
+            if not token_address:
+                raise ValueError(f"Unknown token: {token_name}")
+            template = {
+                'to': Web3.to_checksum_address(token_address),
+                'decimals': self._get_token_decimals(token_name),
+                'gas': 100000,
+                'chainId': self.chain_id
+            }
+            self._transfer_templates[token_name] = template
+        return template
+
+    def submit_eth_transfer(self, from_account: str, to_account: str, amount_eth: float,
+                            private_key: str, nonce: Optional[int] = None) -> str:
+        """Broadcast an ETH transfer without waiting for the receipt"""
+        account = Account.from_key(private_key)
+
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_account))
+
+        tx = {
+            'from': Web3.to_checksum_address(from_account),
+            'to': Web3.to_checksum_address(to_account),
+            'value': self.w3.to_wei(amount_eth, 'ether'),
+            'gas': 21000,
+            'gasPrice': self.w3.eth.gas_price,
+            'nonce': nonce
+        }
+
+        signed_tx = account.sign_transaction(tx)
+        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        return tx_hash.hex()
+
+    def poll_receipts(self, tx_hashes: list, timeout: int = 120) -> list:
+        """Wait for the receipts of several previously submitted transactions"""
+        return [self.wait_for_receipt(tx_hash, timeout=timeout)
+                for tx_hash in tx_hashes]
+
+    def transfer_erc20(self, token_name: str, from_account: str, to_account: str,
                        amount: float, private_key: str) -> dict:
         """Transfer ERC20 tokens between accounts"""
         try:
-            token_address = self.get_contract_address(token_name)
-            if not token_address:
-                return {"success": False, "error": f"Unknown token: {token_name}"}
-            
-            # Convert amount to wei
-            decimals = self._get_token_decimals(token_name)
-            amount_wei = int(amount * (10 ** decimals))
-            
-            # Create contract instance
-            token_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=self._get_erc20_abi()
+            tx_hash = self.submit_erc20_transfer(
+                token_name, from_account, to_account, amount, private_key
             )
-            
-            # Build transaction
-            tx = token_contract.functions.transfer(
-                Web3.to_checksum_address(to_account),
-                amount_wei
-            ).build_transaction({
-                'from': Web3.to_checksum_address(from_account),
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_account))
-            })
-            
-            # Sign and send transaction
-            from eth_account import Account
-            account = Account.from_key(private_key)
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            
+
             # Wait for receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            
+            receipt = self.wait_for_receipt(tx_hash)
+
             return {
                 "success": receipt['status'] == 1,
                 "tx_hash": receipt['transactionHash'].hex(),
                 "gas_used": receipt['gasUsed']
             }
-            
+
         except Exception as e:
             return {"success": False, "error": str(e)}
     
@@ -127,16 +292,9 @@ class BlockchainClient:
             decimals = self._get_token_decimals(token_name)
             amount_wei = int(amount * (10 ** decimals))
             
-            # Known whale addresses for major tokens
-            whale_addresses = {
-                self.get_contract_address("USDC"): "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503",
-                self.get_contract_address("DAI"): "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503", 
-                self.get_contract_address("WETH"): "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503"
-            }
-            
-            whale = whale_addresses.get(token_address)
+            whale = _WHALE_BY_TOKEN.get(token_name)
             if not whale:
-                raise Exception(f"No whale address found for token {token_address}")
+                raise Exception(f"No whale address found for token {token_name}")
             
             # Impersonate whale
             self.w3.provider.make_request("anvil_impersonateAccount", [whale])
@@ -176,54 +334,17 @@ class BlockchainClient:
     
     def send_eth(self, from_account: str, to_account: str, amount_eth: float, private_key: str) -> str:
         """Send ETH from one account to another"""
-        account = Account.from_key(private_key)
-        
-        tx = {
-            'from': Web3.to_checksum_address(from_account),
-            'to': Web3.to_checksum_address(to_account),
-            'value': self.w3.to_wei(amount_eth, 'ether'),
-            'gas': 21000,
-            'gasPrice': self.w3.eth.gas_price,
-            'nonce': self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_account))
-        }
-        
-        signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        
+        tx_hash = self.submit_eth_transfer(from_account, to_account, amount_eth, private_key)
+        receipt = self.wait_for_receipt(tx_hash)
         return receipt['transactionHash'].hex()
     
     def _get_erc20_abi(self):
-        """Minimal ERC20 ABI"""
-        return [
-            {
-                "constant": True,
-                "inputs": [{"name": "_owner", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "balance", "type": "uint256"}],
-                "type": "function"
-            },
-            {
-                "constant": False,
-                "inputs": [
-                    {"name": "_to", "type": "address"},
-                    {"name": "_value", "type": "uint256"}
-                ],
-                "name": "transfer",
-                "outputs": [{"name": "", "type": "bool"}],
-                "type": "function"
-            },
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "decimals",
-                "outputs": [{"name": "", "type": "uint8"}],
-                "type": "function"
-            }
-        ]
+        """Minimal ERC20 ABI (shared module constant)"""
+        return _ERC20_ABI
     
+    @lru_cache(maxsize=256)
     def _get_token_decimals(self, token_name: str) -> int:
-        """Get decimal places for a token"""
+        """Get decimal places for a token (memoized; deterministic per token)"""
         # Hardcoded for known tokens (could query contract in production)
         decimals_map = {
             "USDC": 6,
@@ -233,8 +354,9 @@ class BlockchainClient:
         }
         return decimals_map.get(token_name, 18)
     
+    @lru_cache(maxsize=256)
     def get_contract_address(self, name: str) -> str:
-        """Get contract address from config"""
+        """Get contract address from config (memoized; addresses never change)"""
         return self.config["contracts"].get(name, "")
 
 
@@ -3,13 +3,23 @@ Main Green Agent Evaluator
 Orchestrates the entire evaluation process
 """
 
+from collections import deque
 from typing import Dict, Any, List
 import json
+import threading
 from ..blockchain.web3_client import BlockchainClient
 from ..blockchain.state_manager import StateManager
 from .instruction_generator import InstructionGenerator
 from ..operations.erc20_transfer import ERC20Transfer
 
+# Anvil default account #0 private key (local testing only)
+_ANVIL_TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+# Static banner strings, built once at import instead of "=" * n per print
+_RULE_60 = "=" * 60
+_RULE_80 = "=" * 80
+_SUITE_BANNER = "\n[START] Starting Green Agent Test Suite\n" + _RULE_80
+
 
 class GreenAgentEvaluator:
     """
@@ -28,8 +38,13 @@ class GreenAgentEvaluator:
             "send_erc20": ERC20Transfer(self.client)
         }
         
-        # Evaluation history
-        self.evaluation_results = []
+        # Evaluation history; lock-guarded so evaluators driven from
+        # multiple threads (e.g. one per Anvil instance) can record
+        # results concurrently without losing appends. Bounded so a
+        # long-lived evaluator (a2a server looping over suites) keeps
+        # the most recent results instead of growing without limit.
+        self.evaluation_results = deque(maxlen=1000)
+        self._results_lock = threading.Lock()
     
     def evaluate_scenario(self, test_scenario: Dict[str, Any], white_agent_response: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -58,7 +73,7 @@ class GreenAgentEvaluator:
         account = test_scenario.get("start_state", {}).get("account", self.client.accounts['deployer'])
         
         print(f"\n Evaluating Scenario: {scenario_id}")
-        print("=" * 60)
+        print(_RULE_60)
         
         # Step 1: Setup initial state
         print("[INFO] Step 1: Setting up initial blockchain state...")
@@ -99,10 +114,13 @@ class GreenAgentEvaluator:
             tolerance=0.01  # 1% tolerance for price fluctuations
         )
         
-        print(f"[RESULT] Verification: {'PASSED' if verification_result['success'] else 'FAILED'}")
-        print(f"   Matches: {verification_result['matches']}")
-        print(f"   Current: {verification_result['current_state']}")
-        print(f"   Expected: {verification_result['expected_state']}")
+        # One write for the whole block instead of a flush per line
+        print(
+            f"[RESULT] Verification: {'PASSED' if verification_result['success'] else 'FAILED'}\n"
+            f"   Matches: {verification_result['matches']}\n"
+            f"   Current: {verification_result['current_state']}\n"
+            f"   Expected: {verification_result['expected_state']}"
+        )
         
         # Compile result
         result = {
@@ -114,8 +132,9 @@ class GreenAgentEvaluator:
             "state_verification": verification_result,
             "execution_result": execution_result
         }
-        
-        self.evaluation_results.append(result)
+
+        with self._results_lock:
+            self.evaluation_results.append(result)
         return result
     
     def _execute_operations(self, test_scenario: Dict[str, Any], account: str) -> Dict[str, Any]:
@@ -124,7 +143,7 @@ class GreenAgentEvaluator:
         results = []
         
         # Use test private key (Anvil default account #0)
-        private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+        private_key = _ANVIL_TEST_KEY
         
         for op in operations:
             if isinstance(op, dict):
@@ -159,7 +178,7 @@ class GreenAgentEvaluator:
         
         print(f"\n[EVAL] Evaluating Scenario: {scenario_id}")
         print(f"[AGENT] Using White Agent: {white_agent.name}")
-        print("=" * 60)
+        print(_RULE_60)
         
         # Step 1: Setup initial blockchain state
         print("[INFO] Step 1: Setting up initial blockchain state...")
@@ -229,19 +248,26 @@ class GreenAgentEvaluator:
             },
             "state_verification": verification_result
         }
-        
-        self.evaluation_results.append(result)
+
+        with self._results_lock:
+            self.evaluation_results.append(result)
         return result
     
     def run_test_suite(self, test_scenarios: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Run a full test suite with multiple scenarios
-        
+
+        Scenarios run serially on purpose: every scenario sets up and
+        verifies balances on the same Anvil chain, so interleaving two
+        evaluations would corrupt each other's start/end state. To run
+        scenarios in parallel, point separate evaluators at separate
+        RPC endpoints and merge their evaluation_results (the history
+        appends are already thread-safe).
+
         Returns:
             Summary of all test results
         """
-        print("\n[START] Starting Green Agent Test Suite")
-        print("=" * 80)
+        print(_SUITE_BANNER)
         
         total = len(test_scenarios)
         passed = 0
@@ -259,53 +285,58 @@ class GreenAgentEvaluator:
             "passed": passed,
             "failed": failed,
             "success_rate": (passed / total * 100) if total > 0 else 0,
-            "results": self.evaluation_results
+            "results": list(self.evaluation_results)
         }
         
-        print("\n" + "=" * 80)
-        print("[DATA] TEST SUITE SUMMARY")
-        print("=" * 80)
-        print(f"Total Tests: {total}")
-        print(f"[OK] Passed: {passed}")
-        print(f"[ERROR] Failed: {failed}")
-        print(f"[STATS] Success Rate: {summary['success_rate']:.1f}%")
+        print(
+            "\n" + _RULE_80 + "\n"
+            "[DATA] TEST SUITE SUMMARY\n"
+            + _RULE_80 + "\n"
+            f"Total Tests: {total}\n"
+            f"[OK] Passed: {passed}\n"
+            f"[ERROR] Failed: {failed}\n"
+            f"[STATS] Success Rate: {summary['success_rate']:.1f}%"
+        )
         
         return summary
     
     def export_results(self, filename: str = "evaluation_results.json"):
         """Export evaluation results to JSON file"""
         with open(filename, 'w') as f:
-            json.dump(self.evaluation_results, f, indent=2)
+            json.dump(list(self.evaluation_results), f, indent=2)
         print(f"\n[SAVE] Results exported to {filename}")
 
 
-if __name__ == "__main__":
-    # Example test
-    evaluator = GreenAgentEvaluator()
-    
-    test_scenario = {
-        "id": "test_001",
-        "name": "Simple ERC20 Transfer",
-        "start_state": {
-            "account": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
-            "ETH_balance": 10.0,
-            "USDC_balance": 5000
-        },
-        "operations": [
-            {
-                "type": "send_erc20",
-                "params": {
-                    "token": "USDC",
-                    "to": "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
-                    "amount": 1000
-                }
+# Static example scenario for the smoke run below; module-level so the
+# table is built once at import and reusable by other drivers
+EXAMPLE_SCENARIO = {
+    "id": "test_001",
+    "name": "Simple ERC20 Transfer",
+    "start_state": {
+        "account": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+        "ETH_balance": 10.0,
+        "USDC_balance": 5000
+    },
+    "operations": [
+        {
+            "type": "send_erc20",
+            "params": {
+                "token": "USDC",
+                "to": "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+                "amount": 1000
             }
-        ],
-        "end_state": {
-            "account": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
-            "USDC_balance": 4000
         }
+    ],
+    "end_state": {
+        "account": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+        "USDC_balance": 4000
     }
-    
-    result = evaluator.evaluate_scenario(test_scenario)
+}
+
+
+if __name__ == "__main__":
+    # Example test
+    evaluator = GreenAgentEvaluator()
+
+    result = evaluator.evaluate_scenario(EXAMPLE_SCENARIO)
     print(f"\n[COMPLETE] Final Result: {result}")
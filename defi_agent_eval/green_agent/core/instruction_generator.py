@@ -3,7 +3,17 @@ Natural Language Instruction Generator
 Converts <start_state, operations, end_state> into natural language instructions
 """
 
-from typing import Dict, List, Any
+import json
+from typing import Dict, Any
+
+# Lending phrasing tables, built once at import instead of per call
+_LENDING_VERBS = {
+    "supply": "Supply",
+    "borrow": "Borrow",
+    "withdraw": "Withdraw",
+    "repay": "Repay"
+}
+_DEPOSIT_ACTIONS = frozenset({"supply", "repay"})
 
 
 class InstructionGenerator:
@@ -17,6 +27,12 @@ class InstructionGenerator:
             "lending_1inch": self._generate_lending,
             "bridge_rollup": self._generate_bridge
         }
+
+        # Generation is pure string work over the scenario dict, so
+        # repeated evaluations of the same scenario (suite reruns,
+        # retries) can reuse the formatted instruction. Scenario dicts
+        # are unhashable, so the cache is keyed by their canonical JSON.
+        self._context_cache: Dict[str, str] = {}
     
     def generate_instruction(self, test_scenario: Dict[str, Any]) -> str:
         """
@@ -106,15 +122,10 @@ class InstructionGenerator:
         amount = params.get("amount", 1000)
         protocol = params.get("protocol", "1inch")
         
-        action_verb = {
-            "supply": "Supply",
-            "borrow": "Borrow", 
-            "withdraw": "Withdraw",
-            "repay": "Repay"
-        }.get(action, "Supply")
-        
+        action_verb = _LENDING_VERBS.get(action, "Supply")
+
         return (
-            f"{action_verb} {amount} {token} {'to' if action in ['supply', 'repay'] else 'from'} "
+            f"{action_verb} {amount} {token} {'to' if action in _DEPOSIT_ACTIONS else 'from'} "
             f"{protocol} lending protocol. Make sure to approve the protocol to access your tokens first."
         )
     
@@ -133,6 +144,13 @@ class InstructionGenerator:
     
     def generate_with_context(self, test_scenario: Dict[str, Any]) -> str:
         """Generate instruction with full context including constraints"""
+        try:
+            cache_key = json.dumps(test_scenario, sort_keys=True, default=str)
+        except TypeError:
+            cache_key = None
+        if cache_key is not None and cache_key in self._context_cache:
+            return self._context_cache[cache_key]
+
         instruction = self.generate_instruction(test_scenario)
         
         # Add context about start and end states
@@ -154,35 +172,41 @@ Your current account state:
             for key, value in end_state.items():
                 if key != "account":
                     context += f"  - {key}: {value}\n"
-        
-        return context.strip()
 
+        result = context.strip()
+        if cache_key is not None:
+            self._context_cache[cache_key] = result
+        return result
 
-if __name__ == "__main__":
-    # Test instruction generation
-    generator = InstructionGenerator()
-    
-    test_scenario = {
-        "start_state": {
-            "account": "0x123...",
-            "ETH_balance": 10.0,
-            "USDC_balance": 0
-        },
-        "operations": [
-            {
-                "type": "swap_uniswap",
-                "params": {
-                    "from_token": "ETH",
-                    "to_token": "USDC",
-                    "amount": 1.0,
-                    "slippage_tolerance": 0.5
-                }
+
+# Static example scenario for the smoke run below, hoisted to module
+# level so the table is built once at import
+EXAMPLE_SCENARIO = {
+    "start_state": {
+        "account": "0x123...",
+        "ETH_balance": 10.0,
+        "USDC_balance": 0
+    },
+    "operations": [
+        {
+            "type": "swap_uniswap",
+            "params": {
+                "from_token": "ETH",
+                "to_token": "USDC",
+                "amount": 1.0,
+                "slippage_tolerance": 0.5
             }
-        ],
-        "end_state": {
-            "ETH_balance": 9.0,
-            "USDC_balance": 2000
         }
+    ],
+    "end_state": {
+        "ETH_balance": 9.0,
+        "USDC_balance": 2000
     }
-    
-    print(generator.generate_with_context(test_scenario))
+}
+
+
+if __name__ == "__main__":
+    # Test instruction generation
+    generator = InstructionGenerator()
+
+    print(generator.generate_with_context(EXAMPLE_SCENARIO))
@@ -2,8 +2,14 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# slots=True everywhere: the evaluator creates one TradingAction per
+# decision and one EquityPoint-sized record per cycle per agent, so
+# dropping the per-instance __dict__ keeps attribute access on the hot
+# scoring paths a fixed-offset load. Not frozen — the evaluator mutates
+# quantities and scores in place.
 
-@dataclass
+
+@dataclass(slots=True)
 class TradingAction:
     symbol: str
     action: str  # open_long | open_short | close_long | close_short | hold | wait
@@ -17,14 +23,14 @@ class TradingAction:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingDecision:
     summary: str
     reasoning: str
     actions: List[TradingAction] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningEvaluation:
     agent_name: str
     cycle_idx: int
@@ -40,7 +46,7 @@ class ReasoningEvaluation:
     suggestions: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentRoundDecision:
     agent_name: str
     day: int
@@ -52,7 +58,7 @@ class AgentRoundDecision:
     full_reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DisclosurePackage:
     round_number: int
     disclosure_day: int
@@ -60,7 +66,7 @@ class DisclosurePackage:
     agents_round_summary: List[Dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentReasoningQuality:
     agent_name: str
     total_evaluations: int
@@ -75,7 +81,7 @@ class AgentReasoningQuality:
     poor_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPerformance:
     agent_name: str
     strategy: str
@@ -97,6 +103,7 @@ class AgentPerformance:
     efficiency_score: float = 0.0
     robustness_score: float = 0.0
     reasoning_score: float = 0.0
+    normalized_trading_score: float = 0.0
     total_score: float = 0.0
     created_at: datetime = field(default_factory=datetime.utcnow)
 
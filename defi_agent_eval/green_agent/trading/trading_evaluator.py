@@ -15,12 +15,12 @@ from __future__ import annotations
 
 import json
 import math
-from datetime import datetime
 import os
+import sys
 import requests
-from litellm import completion
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from white_agent.trading_agent.backtest_account import BacktestAccount, Position
@@ -31,16 +31,13 @@ from .data import (
     add_indicators,
     last_rows,
     window_df,
-    INTERVAL_TO_SECONDS,
 )
 from .models import (
     TradingAction,
     TradingDecision,
     AgentRoundDecision,
     DisclosurePackage,
-    ReasoningEvaluation,
     AgentPerformance,
-    AgentReasoningQuality,
 )
 from .ai_cache import AICache
 
@@ -76,6 +73,11 @@ DEFAULT_CONFIG: Dict = {
 }
 
 
+# Display labels for position sides, computed once instead of a
+# str().upper() per position on every prompt build
+_SIDE_LABELS = {"long": "LONG", "short": "SHORT"}
+
+
 class TradingEvaluator:
     """
     Core orchestrator for the trading competition.
@@ -106,6 +108,12 @@ class TradingEvaluator:
         self.data_4h: Dict[str, pd.DataFrame] = {}
         self.data_3m: Dict[str, pd.DataFrame] = {}
 
+        # Structure-of-arrays price index over data_4h: per symbol one
+        # sorted int64 open_time array + one float64 close array, plus a
+        # per-timestamp price-map cache. Built in load_and_prepare_data.
+        self._price_index: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._price_map_cache: Dict[pd.Timestamp, Dict[str, float]] = {}
+
         self.current_round = 0
         self.round_decisions: List[AgentRoundDecision] = []
         self.disclosure_packages: List[DisclosurePackage] = []
@@ -145,6 +153,21 @@ class TradingEvaluator:
             self.data_4h[symbol] = add_indicators(four_h)
             self.data_3m[symbol] = add_indicators(three_m)
 
+        self._build_price_index()
+
+    def _build_price_index(self):
+        """Extract sorted open_time/close column arrays per symbol."""
+        self._price_index = {}
+        self._price_map_cache = {}
+        for symbol, df in self.data_4h.items():
+            if df.empty:
+                continue
+            # asi8 yields epoch-ns int64 regardless of the column's
+            # stored unit (pandas 2 may keep datetime64[us] here)
+            times = pd.DatetimeIndex(df["open_time"]).as_unit("ns").asi8
+            closes = df["close"].to_numpy(dtype=np.float64)
+            self._price_index[symbol] = (times, closes)
+
     # ------------------------------------------------------------------ #
     # Prompt building
     # ------------------------------------------------------------------ #
@@ -286,7 +309,7 @@ class TradingEvaluator:
         cp_str = f"{current_price:.2f}" if current_price is not None else "N/A"
         entry_str = f"{pos.entry_price:.2f}" if pos.entry_price is not None else "N/A"
         liq_str = f"{pos.liquidation_price:.2f}" if pos.liquidation_price is not None else "N/A"
-        side_str = str(pos.side).upper() if pos.side else "N/A"
+        side_str = _SIDE_LABELS.get(pos.side) or (str(pos.side).upper() if pos.side else "N/A")
         symbol_str = str(pos.symbol) if pos.symbol else "N/A"
         qty_str = f"{pos.quantity:.4f}" if pos.quantity is not None else "0.0000"
         notional_str = f"{notional:.2f}" if notional is not None else "0.00"
@@ -388,12 +411,25 @@ class TradingEvaluator:
         return ", ".join(f"{v:.4f}" for v in series.tolist())
 
     def _current_price_map(self, timestamp: pd.Timestamp) -> Dict[str, float]:
+        # Called several times per agent per cycle (prompt build,
+        # execution, leaderboard); one binary search per symbol on the
+        # column arrays replaces a boolean-mask filter per call, and the
+        # resulting map is cached per timestamp
+        if not self._price_index and self.data_4h:
+            # Data was injected without load_and_prepare_data (tests)
+            self._build_price_index()
+
+        cached = self._price_map_cache.get(timestamp)
+        if cached is not None:
+            return cached
+
+        ts_ns = pd.Timestamp(timestamp).value
         price_map: Dict[str, float] = {}
-        for symbol, df in self.data_4h.items():
-            latest = df[df["open_time"] <= timestamp].tail(1)
-            if latest.empty:
-                continue
-            price_map[symbol] = float(latest.iloc[0].close)
+        for symbol, (times, closes) in self._price_index.items():
+            idx = np.searchsorted(times, ts_ns, side="right") - 1
+            if idx >= 0:
+                price_map[symbol] = float(closes[idx])
+        self._price_map_cache[timestamp] = price_map
         return price_map
 
     def _read_agent_positions(self, agent_name: str) -> List[Position]:
@@ -472,7 +508,12 @@ class TradingEvaluator:
         cycle_idx = len(self.equity_history[agent_name]) + 1
 
         for action in decision.actions:
-            symbol = action.symbol.upper()
+            # Intern the normalized symbol: .upper() allocates a fresh
+            # string per action, but the same few tickers recur for the
+            # whole competition — interning collapses them to one object
+            # each, so the price-map lookups below and every TradeEvent
+            # retained in trade_history share it
+            symbol = sys.intern(action.symbol.upper())
             if symbol not in price_map:
                 continue
             price = price_map[symbol]
@@ -788,22 +829,22 @@ class TradingEvaluator:
     def calculate_sharpe_ratio(self, equity_points: List[EquityPoint]) -> float:
         if len(equity_points) < 2:
             return 0.0
-        returns = []
-        for prev, curr in zip(equity_points[:-1], equity_points[1:]):
-            if prev.equity <= 0:
-                continue
-            r = (curr.equity - prev.equity) / prev.equity
-            returns.append(r)
-        if not returns:
+        # Vectorized over the whole curve: one array build, then the
+        # per-cycle returns, mean and sample std come out of numpy
+        # instead of three Python loops over the points
+        equity = np.fromiter((p.equity for p in equity_points), dtype=np.float64)
+        prev = equity[:-1]
+        valid = prev > 0
+        returns = (equity[1:][valid] - prev[valid]) / prev[valid]
+        if returns.size < 2:
             return 0.0
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / max(1, len(returns) - 1)
-        std = math.sqrt(variance)
+        mean = returns.mean()
+        std = returns.std(ddof=1)
         if std == 0:
             return 0.0
         # Scale to annualized using 4h interval (~6 per day -> 2190 per year)
         scale = math.sqrt(2190)
-        return (mean / std) * scale
+        return float(mean / std) * scale
 
     def _calculate_performance(self, agent_name: str) -> AgentPerformance:
         equity_points = self.equity_history[agent_name]
@@ -832,13 +873,23 @@ class TradingEvaluator:
         sharpe = self.calculate_sharpe_ratio(equity_points)
         max_drawdown = max((p.drawdown_pct for p in equity_points), default=0.0)
         trades = self.trade_history[agent_name]
-        wins = [t for t in trades if t.realized_pnl > 0]
-        losses = [t for t in trades if t.realized_pnl < 0]
-        win_rate = len(wins) / len(trades) * 100 if trades else 0.0
+        # One pass over the trade list: the win/loss counts and pnl sums
+        # come out together instead of materializing wins/losses lists
+        # and re-summing each
+        win_count = loss_count = 0
+        win_pnl = loss_pnl = 0.0
+        for t in trades:
+            if t.realized_pnl > 0:
+                win_count += 1
+                win_pnl += t.realized_pnl
+            elif t.realized_pnl < 0:
+                loss_count += 1
+                loss_pnl += t.realized_pnl
+        win_rate = win_count / len(trades) * 100 if trades else 0.0
         profit_factor = (
-            (sum(t.realized_pnl for t in wins) / abs(sum(t.realized_pnl for t in losses)))
-            if losses
-            else float("inf") if wins else 0.0
+            win_pnl / abs(loss_pnl)
+            if loss_count
+            else float("inf") if win_count else 0.0
         )
         # Approx days from decision count
         days = max(1, len(equity_points) / self.config["decisions_per_day"])
@@ -942,7 +993,7 @@ class TradingEvaluator:
                 vol * 0.10
             )
             reasoning = p.reasoning_score or 0.0
-            p.normalized_trading_score = normalized_trading  # type: ignore
+            p.normalized_trading_score = normalized_trading
             p.total_score = normalized_trading * 0.7 + reasoning * 0.3
         return perfs
 
@@ -39,71 +39,74 @@ class SimpleTestAgent(WhiteAgent):
         )
 
 
+# Static demo payloads: pure constants (no randomness or per-run state),
+# so they are built once at import instead of on every main() call
+_CLI_INSTRUCTION = "Transfer 1000 USDC to 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1"
+_CLI_CONTEXT = {
+    'cli_command': 'cast send 0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48 "transfer(address,uint256)" 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1 1000000000 --rpc-url http://localhost:8545'
+}
+
+_CODE_INSTRUCTION = "Swap 500 USDC for ETH on Uniswap"
+_CODE_CONTEXT = {
+    'python_code': 'contract = w3.eth.contract(address=uniswap_router, abi=router_abi)\ntx = contract.functions.swapExactTokensForETH(...).build_transaction({...})'
+}
+
+_LLM_INSTRUCTION = "Vote YES on DAO proposal #42 using my governance tokens"
+_LLM_CONTEXT = {
+    'initial_state': {'governance_tokens': 10000}
+}
+
+# One table drives all demo cases; the per-case code below is a single
+# loop body instead of three copies of the same block
+_DEMO_CASES = (
+    ("1️⃣  CLI White Agent (uses Foundry cast commands)", _CLI_INSTRUCTION, _CLI_CONTEXT),
+    ("2️⃣  Code White Agent (uses Web3.py Python code)", _CODE_INSTRUCTION, _CODE_CONTEXT),
+    ("3️⃣  LLM White Agent (autonomously interprets instructions)", _LLM_INSTRUCTION, _LLM_CONTEXT),
+)
+
+
 def main():
-    print("\n" + "=" * 70)
-    print("[AGENT] White Agent Architecture Demo")
-    print("=" * 70)
-    
-    print("\nWhite agents are AI agents that:")
-    print("  1. Receive natural language instructions")
-    print("  2. Execute blockchain operations")
-    print("  3. Are evaluated by the green agent for correctness & safety")
-    
-    print("\n" + "-" * 70)
-    print("Three Types of White Agents Created:")
-    print("-" * 70)
+    # Static blocks go out as one write each instead of a print (lock +
+    # flush) per line; only the per-case lines interleave with execution
+    print(
+        "\n" + "=" * 70 + "\n"
+        "[AGENT] White Agent Architecture Demo\n"
+        + "=" * 70 + "\n"
+        "\nWhite agents are AI agents that:\n"
+        "  1. Receive natural language instructions\n"
+        "  2. Execute blockchain operations\n"
+        "  3. Are evaluated by the green agent for correctness & safety\n"
+        "\n" + "-" * 70 + "\n"
+        "Three Types of White Agents Created:\n"
+        + "-" * 70
+    )
     
     agent = SimpleTestAgent("Demo Agent", "Demonstrates white agent interface")
     
-    # Test 1: CLI-based execution
-    print("\n1️⃣  CLI White Agent (uses Foundry cast commands)")
-    instruction1 = "Transfer 1000 USDC to 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1"
-    context1 = {
-        'cli_command': 'cast send 0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48 "transfer(address,uint256)" 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb1 1000000000 --rpc-url http://localhost:8545'
-    }
-    print(f"  Instruction: {instruction1}")
-    result1 = agent.execute_instruction(instruction1, context1)
-    print(f"  [OK] Success: {result1.success} (execution time: {result1.execution_time:.3f}s)")
-    
-    # Test 2: Code-based execution
-    print("\n2️⃣  Code White Agent (uses Web3.py Python code)")
-    instruction2 = "Swap 500 USDC for ETH on Uniswap"
-    context2 = {
-        'python_code': 'contract = w3.eth.contract(address=uniswap_router, abi=router_abi)\ntx = contract.functions.swapExactTokensForETH(...).build_transaction({...})'
-    }
-    print(f"  Instruction: {instruction2}")
-    result2 = agent.execute_instruction(instruction2, context2)
-    print(f"  [OK] Success: {result2.success} (execution time: {result2.execution_time:.3f}s)")
-    
-    # Test 3: LLM-based execution
-    print("\n3️⃣  LLM White Agent (autonomously interprets instructions)")
-    instruction3 = "Vote YES on DAO proposal #42 using my governance tokens"
-    context3 = {
-        'initial_state': {'governance_tokens': 10000}
-    }
-    print(f"  Instruction: {instruction3}")
-    result3 = agent.execute_instruction(instruction3, context3)
-    print(f"  [OK] Success: {result3.success} (execution time: {result3.execution_time:.3f}s)")
-    
-    print("\n" + "-" * 70)
-    print("Files Created:")
-    print("-" * 70)
-    print("  📄 white_agent/base_agent.py    - Base WhiteAgent interface")
-    print("  📄 white_agent/cli_agent.py     - CLI-based agent (Foundry cast)")
-    print("  📄 white_agent/code_agent.py    - Code-based agent (Web3.py)")
-    print("  📄 white_agent/llm_agent.py     - LLM-based agent (autonomous)")
-    print("  📄 white_agent/__init__.py      - Package exports")
-    
-    print("\n" + "=" * 70)
-    print("[OK] White Agent Architecture Complete!")
-    print("=" * 70)
+    for title, instruction, context in _DEMO_CASES:
+        print(f"\n{title}")
+        print(f"  Instruction: {instruction}")
+        result = agent.execute_instruction(instruction, context)
+        print(f"  [OK] Success: {result.success} (execution time: {result.execution_time:.3f}s)")
     
-    print("\nNext Steps:")
-    print("  1. Install Foundry/Anvil: curl -L https://foundry.paradigm.xyz | bash")
-    print("  2. Start Anvil fork: anvil --fork-url <ALCHEMY_URL>")
-    print("  3. Run full integration test with real blockchain")
-    print("  4. Implement remaining operations (Uniswap, DAO, lending, bridging)")
-    print()
+    print(
+        "\n" + "-" * 70 + "\n"
+        "Files Created:\n"
+        + "-" * 70 + "\n"
+        "  📄 white_agent/base_agent.py    - Base WhiteAgent interface\n"
+        "  📄 white_agent/cli_agent.py     - CLI-based agent (Foundry cast)\n"
+        "  📄 white_agent/code_agent.py    - Code-based agent (Web3.py)\n"
+        "  📄 white_agent/llm_agent.py     - LLM-based agent (autonomous)\n"
+        "  📄 white_agent/__init__.py      - Package exports\n"
+        "\n" + "=" * 70 + "\n"
+        "[OK] White Agent Architecture Complete!\n"
+        + "=" * 70 + "\n"
+        "\nNext Steps:\n"
+        "  1. Install Foundry/Anvil: curl -L https://foundry.paradigm.xyz | bash\n"
+        "  2. Start Anvil fork: anvil --fork-url <ALCHEMY_URL>\n"
+        "  3. Run full integration test with real blockchain\n"
+        "  4. Implement remaining operations (Uniswap, DAO, lending, bridging)\n"
+    )
 
 
 if __name__ == "__main__":
@@ -6,19 +6,29 @@ Collection of white agents (AI agents being evaluated) that execute blockchain o
 
 from .base_agent import WhiteAgent, ExecutionResult
 
-# Import agents that require web3 only if available
-try:
-    from .cli_agent import CLIWhiteAgent
-    from .code_agent import CodeWhiteAgent
-    from .llm_agent import LLMWhiteAgent
-    from .trading_agent import RealWorldTradingAgent  # Real exchange trading
-    _all_agents_available = True
-except ImportError:
-    _all_agents_available = False
-    CLIWhiteAgent = None
-    CodeWhiteAgent = None
-    LLMWhiteAgent = None
-    RealWorldTradingAgent = None
+# The concrete agents pull in web3/openai/dotenv — hundreds of ms of import
+# time. Resolve them lazily (PEP 562) so `from white_agent import
+# ExecutionResult` stays cheap for callers that never touch an agent.
+_LAZY_AGENTS = {
+    'CLIWhiteAgent': '.cli_agent',
+    'CodeWhiteAgent': '.code_agent',
+    'LLMWhiteAgent': '.llm_agent',
+    'RealWorldTradingAgent': '.trading_agent',  # Real exchange trading
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_AGENTS:
+        import importlib
+        try:
+            module = importlib.import_module(_LAZY_AGENTS[name], __name__)
+            agent = getattr(module, name)
+        except ImportError:
+            agent = None  # optional dependency missing, keep old behavior
+        globals()[name] = agent
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'WhiteAgent',
@@ -5,14 +5,30 @@ White agents receive natural language instructions and execute blockchain operat
 They are the AI agents being evaluated by the green agent.
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+# Monotonic clock for measuring durations; cheaper and more precise than
+# time.time(), which agents should only use for wall-clock timestamps.
+_now = time.perf_counter
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionResult:
-    """Result of executing an instruction"""
+    """
+    Result of executing an instruction
+
+    slots=True: one of these is allocated per executed instruction, so
+    dropping the per-instance __dict__ keeps them compact in long
+    evaluation histories. Not frozen — optimistic confirmation updates
+    success/gas_used on the already-returned result in place. The same
+    in-place updates rule out converting this to a NamedTuple: callers
+    hold references to results that wait_for_completion later resolves,
+    and _replace would only rebind a copy.
+    """
     success: bool
     transaction_hash: Optional[str] = None
     error: Optional[str] = None
@@ -32,10 +48,15 @@ class WhiteAgent(ABC):
     4. Return execution results
     """
     
-    def __init__(self, name: str, description: str):
+    def __init__(self, name: str, description: str, history_limit: int = 1000,
+                 verbose_history: bool = False):
         self.name = name
         self.description = description
-        self.execution_history = []
+        # Ring buffer: long eval campaigns would otherwise retain every
+        # code/command/plan payload ever executed
+        self.execution_history = deque(maxlen=history_limit)
+        # When True, history entries also keep bulky payloads (code, stdout)
+        self.verbose_history = verbose_history
     
     @abstractmethod
     def execute_instruction(self, instruction: str, context: Dict[str, Any]) -> ExecutionResult:
@@ -57,4 +78,4 @@ class WhiteAgent(ABC):
     
     def reset_history(self):
         """Clear execution history"""
-        self.execution_history = []
+        self.execution_history.clear()
@@ -5,11 +5,38 @@ Executes instructions by running Foundry cast commands.
 This agent uses pre-generated CLI commands from the green agent's operations.
 """
 
+import shlex
 import subprocess
+import threading
 import time
-import re
-from typing import Dict, Any
-from .base_agent import WhiteAgent, ExecutionResult
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from .base_agent import WhiteAgent, ExecutionResult, _now
+
+# Ethereum tx hashes are always exactly 0x + 64 hex chars
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+
+# Hard wall-clock bound on a single cast invocation
+_COMMAND_TIMEOUT = 30
+
+
+def _find_tx_hash(data: bytes) -> Optional[str]:
+    """
+    Scan a buffer for the first 0x + 64-hex-chars substring.
+
+    Cheaper than the regex engine on large verbose cast output: bytes.find
+    and bytes.translate both run at C level, so the Python loop only runs
+    once per literal '0x' occurrence.
+    """
+    i = data.find(b'0x')
+    while i != -1:
+        candidate = data[i + 2:i + 66]
+        # translate(None, hex) deletes hex digits; empty result == all hex
+        if len(candidate) == 64 and not candidate.translate(None, _HEX_DIGITS):
+            return data[i:i + 66].decode()
+        i = data.find(b'0x', i + 2)
+    return None
 
 
 class CLIWhiteAgent(WhiteAgent):
@@ -41,8 +68,8 @@ class CLIWhiteAgent(WhiteAgent):
         Returns:
             ExecutionResult with transaction hash and status
         """
-        start_time = time.time()
-        
+        start_time = _now()
+
         # Get the pre-generated CLI command from context
         cli_command = context.get('cli_command')
         if not cli_command:
@@ -52,34 +79,72 @@ class CLIWhiteAgent(WhiteAgent):
             )
         
         try:
-            # Execute the command
-            result = subprocess.run(
-                cli_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            execution_time = time.time() - start_time
-            
-            if result.returncode == 0:
-                # Parse transaction hash from output
-                tx_hash = self._parse_tx_hash(result.stdout)
-                
+            # Execute the command directly (argv list, no /bin/sh fork).
+            # Accepts either a pre-split list or a plain command string.
+            argv = cli_command if isinstance(cli_command, list) else shlex.split(cli_command)
+
+            # Stream stdout line by line instead of buffering it all:
+            # verbose cast traces can be MBs, but we only need the tx hash.
+            # stderr is merged into stdout so a chatty child can never
+            # block on a full, undrained stderr pipe while we read stdout.
+            proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT)
+            tx_hash = None
+            terminated_early = False
+            # Streaming reads have no per-call timeout, so a watchdog
+            # enforces the hard bound: a hung cast (e.g. unreachable RPC
+            # node) gets killed at the deadline, the read loop sees EOF,
+            # and the TimeoutExpired handler below takes over.
+            timed_out = threading.Event()
+
+            def _kill_on_deadline():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(_COMMAND_TIMEOUT, _kill_on_deadline)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                # Keep only a short tail of output for diagnostics unless
+                # the caller asked for the full transcript
+                captured = [] if self.verbose_history else deque(maxlen=50)
+                for line in proc.stdout:
+                    captured.append(line)
+                    if tx_hash is None:
+                        tx_hash = _find_tx_hash(line)
+                        if tx_hash and not self.verbose_history:
+                            # Hash found and the rest of stdout is not wanted
+                            proc.terminate()
+                            terminated_early = True
+                            break
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(argv, _COMMAND_TIMEOUT)
+
+            execution_time = _now() - start_time
+            stdout = b''.join(captured).decode(errors='replace')
+
+            if terminated_early or returncode == 0:
+                if tx_hash is None:
+                    tx_hash = self._parse_tx_hash(stdout)
+
+                metadata = {'command': cli_command}
+                if self.verbose_history:
+                    metadata['stdout'] = stdout
+
                 exec_result = ExecutionResult(
                     success=True,
                     transaction_hash=tx_hash,
                     execution_time=execution_time,
-                    metadata={
-                        'stdout': result.stdout,
-                        'command': cli_command
-                    }
+                    metadata=metadata
                 )
             else:
                 exec_result = ExecutionResult(
                     success=False,
-                    error=result.stderr or result.stdout,
+                    error=stdout,  # merged stdout+stderr tail
                     execution_time=execution_time,
                     metadata={'command': cli_command}
                 )
@@ -97,27 +162,41 @@ class CLIWhiteAgent(WhiteAgent):
         except subprocess.TimeoutExpired:
             return ExecutionResult(
                 success=False,
-                error="Command execution timeout (30s)",
-                execution_time=30.0
+                error=f"Command execution timeout ({_COMMAND_TIMEOUT}s)",
+                execution_time=_now() - start_time
             )
         except Exception as e:
             return ExecutionResult(
                 success=False,
                 error=f"Execution error: {str(e)}",
-                execution_time=time.time() - start_time
+                execution_time=_now() - start_time
             )
     
+    def execute_batch(self, items: List[Tuple[str, Dict[str, Any]]],
+                      max_workers: int = 8) -> List[ExecutionResult]:
+        """
+        Execute several independent instructions concurrently.
+
+        Each instruction blocks on its subprocess (not the GIL), so a small
+        thread pool gives near-linear throughput until the RPC node
+        saturates. Results come back in input order.
+
+        Args:
+            items: List of (instruction, context) pairs
+            max_workers: Thread pool size
+
+        Returns:
+            List of ExecutionResults, one per item, in order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.execute_instruction, instruction, context)
+                       for instruction, context in items]
+            return [future.result() for future in futures]
+
     def _parse_tx_hash(self, output: str) -> str:
         """Extract transaction hash from cast output"""
-        # Look for hex strings that look like transaction hashes (0x + 64 hex chars)
-        match = re.search(r'0x[a-fA-F0-9]{64}', output)
-        if match:
-            return match.group(0)
-        
-        # Look for common cast output patterns
-        if 'transactionHash' in output:
-            match = re.search(r'transactionHash["\s:]+0x[a-fA-F0-9]{64}', output)
-            if match:
-                return re.search(r'0x[a-fA-F0-9]{64}', match.group(0)).group(0)
-        
+        tx_hash = _find_tx_hash(output.encode())
+        if tx_hash:
+            return tx_hash
+
         return output.strip() if output else None
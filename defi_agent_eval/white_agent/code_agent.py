@@ -5,11 +5,21 @@ Executes instructions by running generated Python code using Web3.py.
 This agent uses pre-generated Python code from the green agent's operations.
 """
 
+import builtins
+import hashlib
+import sys
+import threading
 import time
+from pathlib import Path
+from types import CodeType
 from typing import Dict, Any
 from web3 import Web3
 from eth_account import Account
-from .base_agent import WhiteAgent, ExecutionResult
+from .base_agent import WhiteAgent, ExecutionResult, _now
+
+# Path setup for the lazy green_agent import below
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
 
 class CodeWhiteAgent(WhiteAgent):
@@ -23,17 +33,75 @@ class CodeWhiteAgent(WhiteAgent):
     4. Returns execution results
     """
     
-    def __init__(self, rpc_url: str = "http://localhost:8545", private_key: str = None, name: str = "Code Agent"):
+    # Compiled snippets keyed by source hash; the green agent re-emits the
+    # same code for repeated evaluations, so compile each snippet only once.
+    _code_cache: Dict[bytes, CodeType] = {}
+
+    # Small builtins table for executed snippets: name lookups hit a
+    # ~20-entry dict instead of the full builtins module, and as a bonus
+    # the sandbox narrows (no open/eval/exec from generated code).
+    # __import__ and __build_class__ stay in: generated snippets start
+    # with 'from web3 import Web3', and import/class statements resolve
+    # those hooks through __builtins__.
+    _EXEC_BUILTINS = {name: getattr(builtins, name) for name in (
+        'len', 'range', 'int', 'float', 'str', 'bytes', 'list', 'dict',
+        'tuple', 'print', 'getattr', 'setattr', 'isinstance', 'abs',
+        'min', 'max', 'sum', 'round', 'enumerate', 'zip', 'Exception',
+        '__import__', '__build_class__'
+    )}
+
+    def __init__(self, rpc_url: str = "http://localhost:8545", private_key: str = None,
+                 name: str = "Code Agent", ws_url: str = None):
         super().__init__(
             name=name,
             description="Executes blockchain operations using Web3.py Python code"
         )
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Optional WebSocket endpoint: receipt waits become one lookup per
+        # new block instead of an HTTP polling loop
+        self.ws_url = ws_url
+        self._ws_w3 = None
         self.private_key = private_key
         if private_key:
             self.account = Account.from_key(private_key)
         else:
             self.account = None
+        # Warm per-thread base namespaces for exec; see _base_globals
+        self._warm_globals = threading.local()
+
+    def _base_globals(self) -> Dict[str, Any]:
+        """
+        Warm base namespace for executed snippets, one per thread.
+
+        Built once and then shallow-copied per call, so anything a snippet
+        memoizes on it (notably the 'contracts' dict — Web3 contract
+        construction re-parses the ABI every time) survives across calls.
+        """
+        base = getattr(self._warm_globals, 'base', None)
+        if base is None:
+            base = {
+                '__builtins__': self._EXEC_BUILTINS,
+                '__name__': '<white_agent>',  # class bodies read it from globals
+                'w3': self.w3,
+                'account': self.account,
+                'private_key': self.private_key,
+                'Web3': Web3,
+                'Account': Account,
+                'contracts': {}  # snippet-populated cache of contract objects
+            }
+            self._warm_globals.base = base
+        return base
+
+    def _wait_for_receipt(self, tx_hash, timeout: int = 30):
+        """Wait for a receipt, via WebSocket block events when configured"""
+        if self.ws_url:
+            # Deferred so importing this module doesn't initialize the
+            # green_agent package; cached in sys.modules after first use
+            from green_agent.blockchain.web3_client import wait_for_receipt_ws
+            if self._ws_w3 is None:
+                self._ws_w3 = Web3(Web3.WebsocketProvider(self.ws_url))
+            return wait_for_receipt_ws(self._ws_w3, tx_hash, timeout=timeout)
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
     
     def execute_instruction(self, instruction: str, context: Dict[str, Any]) -> ExecutionResult:
         """
@@ -46,8 +114,8 @@ class CodeWhiteAgent(WhiteAgent):
         Returns:
             ExecutionResult with transaction hash and status
         """
-        start_time = time.time()
-        
+        start_time = _now()
+
         # Get the pre-generated Python code from context
         python_code = context.get('python_code')
         if not python_code:
@@ -57,20 +125,22 @@ class CodeWhiteAgent(WhiteAgent):
             )
         
         try:
-            # Prepare execution environment
+            # Prepare execution environment: copy-on-write over the warm
+            # thread-local base so cached contract objects persist
             exec_globals = {
-                'w3': self.w3,
-                'account': self.account,
-                'private_key': self.private_key,
-                'Web3': Web3,
-                'Account': Account,
+                **self._base_globals(),
                 'result': None  # Will be set by the executed code
             }
             
-            # Execute the code
-            exec(python_code, exec_globals)
+            # Execute the code (compiled once per unique snippet)
+            code_key = hashlib.blake2b(python_code.encode()).digest()
+            code_obj = self._code_cache.get(code_key)
+            if code_obj is None:
+                code_obj = compile(python_code, '<white_agent>', 'exec')
+                self._code_cache[code_key] = code_obj
+            exec(code_obj, exec_globals)
             
-            execution_time = time.time() - start_time
+            execution_time = _now() - start_time
             
             # Get result from executed code
             tx_hash = exec_globals.get('result')
@@ -78,7 +148,7 @@ class CodeWhiteAgent(WhiteAgent):
             if tx_hash:
                 # If we got a transaction hash, wait for receipt
                 try:
-                    receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
+                    receipt = self._wait_for_receipt(tx_hash, timeout=30)
                     
                     exec_result = ExecutionResult(
                         success=receipt['status'] == 1,
@@ -105,13 +175,16 @@ class CodeWhiteAgent(WhiteAgent):
                     metadata={'code': python_code}
                 )
             
-            # Record in history
-            self.execution_history.append({
+            # Record in history (full source only when verbose; it dominates
+            # the memory footprint of long campaigns)
+            entry = {
                 'instruction': instruction,
-                'code': python_code,
                 'result': exec_result,
                 'timestamp': time.time()
-            })
+            }
+            if self.verbose_history:
+                entry['code'] = python_code
+            self.execution_history.append(entry)
             
             return exec_result
             
@@ -119,6 +192,6 @@ class CodeWhiteAgent(WhiteAgent):
             return ExecutionResult(
                 success=False,
                 error=f"Code execution error: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=_now() - start_time,
                 metadata={'code': python_code}
             )
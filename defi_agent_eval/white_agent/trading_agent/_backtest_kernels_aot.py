@@ -0,0 +1,51 @@
+"""
+AOT build script for the backtest account kernels.
+
+Running this file with numba installed produces a `backtest_kernels`
+compiled extension next to it:
+
+    python _backtest_kernels_aot.py
+
+backtest_account.py imports the compiled module when present, which
+removes numba's per-process JIT warmup entirely — parameter sweeps that
+spawn a fresh interpreter per run start filling orders immediately.
+Without the extension (or numba) the account falls back to the
+@njit/pure-Python kernels, so building this is strictly optional.
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('backtest_kernels')
+
+
+@cc.export('apply_slippage', 'f8(f8, f8, i4)')
+def apply_slippage(price, rate, open_sign):
+    return price + price * rate * open_sign
+
+
+@cc.export('compute_liquidation', 'f8(f8, i4, i4, f8)')
+def compute_liquidation(entry, leverage, side_sign, mm_rate):
+    if leverage <= 0:
+        return 0.0
+    if mm_rate < 0.0:
+        mm_rate = 0.0
+    base_move = 1.0 / leverage
+    return entry * (1.0 - side_sign * base_move) / max(1e-6, 1.0 - mm_rate)
+
+
+@cc.export('pnl', 'f8(f8, f8, f8, i4)')
+def pnl(entry, price, qty, side_sign):
+    return (price - entry) * side_sign * qty
+
+
+@cc.export('unrealized_pnl_batch', 'f8(f8[:], f8[:], f8[:], i1[:])')
+def unrealized_pnl_batch(entry, current, qty, sign):
+    total = 0.0
+    for i in range(entry.shape[0]):
+        total += (current[i] - entry[i]) * sign[i] * qty[i]
+    return total
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,54 @@
+"""
+On-disk cache for backtest AI decisions.
+
+The AI call is by far the most expensive part of a backtest cycle.
+Re-runs over the same data with the same agent (the normal loop while
+debugging a strategy or prompt) hit identical (timestamp, market data,
+instruction) inputs, so their decisions are content-addressed here as
+small JSON files and replayed instead of re-querying the model.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+
+class DecisionCache:
+    """
+    Content-addressed JSON file cache, one file per decision under
+    {root}/{agent_name}/{key}.json. Misses and I/O errors degrade to
+    "not cached" — the cache never breaks a run.
+    """
+
+    def __init__(self, root: str = '.cache/decisions'):
+        self.root = root
+
+    @staticmethod
+    def make_key(timestamp: int, market_data: Dict, instruction: str) -> str:
+        """Digest of everything that determines a (deterministic) decision"""
+        payload = json.dumps(
+            {'ts': timestamp, 'market_data': market_data, 'instruction': instruction},
+            sort_keys=True, default=str
+        )
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def _path(self, agent_name: str, key: str) -> str:
+        return os.path.join(self.root, agent_name, f"{key}.json")
+
+    def get(self, agent_name: str, key: str) -> Optional[Dict]:
+        """Return the cached decision, or None on miss/corruption"""
+        try:
+            with open(self._path(agent_name, key)) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, agent_name: str, key: str, decision: Dict):
+        """Write-back a fresh decision (best effort)"""
+        path = self._path(agent_name, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(decision, f)
+        except (OSError, TypeError):
+            pass
@@ -25,14 +25,105 @@ Prerequisites:
 - Real funds in exchange account (USE TESTNET FIRST!)
 """
 
+import asyncio
+import io
+import logging
+import math
 import time
 import json
 import os
 import re
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from openai import OpenAI
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from .indicators import sma
+
+# Per-cycle step logging goes through logging so float formatting is
+# skipped entirely when INFO is filtered out (e.g. quiet backtests).
+# The bare-message handler keeps console output identical to the old
+# print-based logs for interactive runs.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+# Static system-prompt template, parsed once at import time; rendering is
+# a single format_map over the handful of dynamic fields, and alternative
+# prompts can be swapped in without touching the builder.
+#
+# Field order matters for cost: the dynamic performance counters sit at
+# the END so everything before them is byte-identical across cycles.
+# OpenAI and DeepSeek both cache prompt prefixes server-side, so the
+# rules + output format (the bulk of the tokens) are prefilled once and
+# reused by every later call; the same reason custom_instruction is
+# appended last in the user prompt.
+_SYSTEM_TMPL = """You are a professional cryptocurrency futures trader operating on {exchange}.
+
+TRADING RULES:
+1. **Risk Management**: Never risk more than 2-5% of account per trade
+2. **Position Sizing**: Scale positions based on confidence and volatility
+3. **Trading Frequency**: Excellent traders make 2-4 trades per day (not every cycle)
+4. **Performance Awareness**: Factor your recent win rate (below) into position sizing
+
+OUTPUT FORMAT:
+You MUST respond with:
+<reasoning>
+[Your detailed Chain of Thought analysis here]
+- Current market conditions
+- Account state analysis
+- Risk assessment
+- Decision rationale
+</reasoning>
+
+<decision>
+{{
+  "action": "open_long" | "open_short" | "close_position" | "hold",
+  "symbol": "BTCUSDT" (or null if hold),
+  "size_usd": 100.0 (or null if hold),
+  "leverage": 5 (or null if hold),
+  "reason": "Brief reason for this decision"
+}}
+</decision>
+
+Think carefully before trading. Not every cycle requires action.
+
+HISTORICAL PERFORMANCE:
+- Total cycles completed: {total_cycles}
+- Winning cycles: {winning_cycles}
+- Win rate: {win_rate:.1f}%
+"""
+
+
+@dataclass(slots=True)
+class DecisionRecord:
+    """
+    One decision cycle, as a slotted dataclass instead of a dict-of-dicts:
+    long sessions keep thousands of these, and slots cut the per-record
+    footprint while making field access explicit (record.success instead
+    of chained .get calls).
+    """
+    cycle_number: int
+    timestamp: str
+    action: str
+    symbol: Optional[str]
+    size_usd: Optional[float]
+    leverage: Optional[int]
+    success: bool
+    reasoning: str
+    execution: Dict[str, Any]
+    market_data: Dict[str, Any]
 
 # Optional imports for different exchanges
 try:
@@ -43,6 +134,12 @@ except ImportError:
     BINANCE_AVAILABLE = False
     print("WARNING: python-binance not installed. Install with: pip install python-binance")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from hyperliquid.exchange import Exchange
     from hyperliquid.info import Info
@@ -54,6 +151,14 @@ except ImportError:
 
 load_dotenv()
 
+# Response-tag patterns, compiled once at import
+_REASONING_RE = re.compile(r'<reasoning>(.*?)</reasoning>', re.DOTALL)
+_DECISION_RE = re.compile(r'<decision>(.*?)</decision>', re.DOTALL)
+
+# How long market-data responses stay fresh. Half a second is safe for
+# market orders and collapses the duplicate price fetches within a cycle.
+_MARKET_DATA_TTL = 0.5
+
 
 class RealWorldTradingAgent:
     """
@@ -78,11 +183,14 @@ class RealWorldTradingAgent:
         testnet: bool = True,  # USE TESTNET FIRST!
         llm_model: str = "gpt-4o",
         llm_api_key: Optional[str] = None,
-        name: str = "Real-World Trading Agent"
+        name: str = "Real-World Trading Agent",
+        persist_decisions: bool = False  # append each decision as NDJSON
     ):
         self.name = name
         self.exchange_type = exchange
         self.testnet = testnet
+        self.persist_decisions = persist_decisions
+        self._decisions_path = f"decisions_{name.replace(' ', '_').lower()}.ndjson"
         
         # Initialize LLM (for AI decisions)
         api_key_llm = llm_api_key or os.getenv("OPENAI_API_KEY") or os.getenv("DEEPSEEK_API_KEY")
@@ -108,8 +216,30 @@ class RealWorldTradingAgent:
         else:
             raise ValueError(f"Unsupported exchange: {exchange}")
         
-        # Decision history for tracking performance
+        # Decision history for tracking performance, plus a rolling
+        # 20-cycle win window so _analyze_history is O(1)
         self.decision_history = []
+        self._win_window = deque(maxlen=20)
+        self._wins_in_window = 0
+
+        # Short-TTL cache for market-data REST calls (price, klines)
+        self._rest_cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+        # Last rendered system prompt, keyed by the performance counters
+        self._sys_prompt_cache: Optional[Tuple[Tuple, str]] = None
+
+        # Per-symbol quantity precision (lazy, one exchange-info call)
+        self._step_precision: Optional[Dict[str, int]] = None
+
+        # Last leverage we set per symbol, to skip redundant change calls
+        self._leverage_cache: Dict[str, int] = {}
+
+        # Cycle timestamp, refreshed once at the top of run_cycle
+        self._cycle_now = datetime.now()
+        self._cycle_now_str = self._cycle_now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # Small pool for speculative work overlapped with the LLM call
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trade-spec")
         
         print(f"[OK] {self.name} initialized")
         print(f"   Exchange: {exchange} ({'TESTNET' if testnet else 'LIVE TRADING'})")
@@ -125,7 +255,14 @@ class RealWorldTradingAgent:
         
         # Create Binance client
         self.exchange = BinanceClient(api_key, api_secret, testnet=testnet)
-        
+
+        # Widen the requests connection pool so concurrent market-data
+        # fetches reuse warm keep-alive connections instead of paying a
+        # TCP+TLS handshake each time the default 10-slot pool overflows
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.exchange.session.mount('https://', adapter)
+        self.exchange.session.headers['Connection'] = 'keep-alive'
+
         if testnet:
             # Set testnet URL for futures
             self.exchange.API_URL = 'https://testnet.binancefuture.com'
@@ -218,10 +355,77 @@ class RealWorldTradingAgent:
                 })
             return positions
     
+    def _fetch_account_snapshot(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Fetch balance and positions in ONE exchange round-trip.
+
+        Binance futures_account() already carries the position list, and
+        Hyperliquid's user_state carries both margin summary and positions,
+        so the separate get_balance/get_positions calls in run_cycle were
+        paying an extra HTTPS round-trip for data we already had.
+        """
+        if self.exchange_type == "binance":
+            account = self.exchange.futures_account()
+            balance = {
+                'total_equity': float(account['totalWalletBalance']),
+                'available_balance': float(account['availableBalance']),
+                'unrealized_pnl': float(account['totalUnrealizedProfit'])
+            }
+            positions = []
+            for pos in account.get('positions', []):
+                pos_amt = float(pos['positionAmt'])
+                if abs(pos_amt) > 0:
+                    positions.append({
+                        'symbol': pos['symbol'],
+                        'side': 'long' if pos_amt > 0 else 'short',
+                        'size': abs(pos_amt),
+                        'entry_price': float(pos['entryPrice']),
+                        # futures_account positions omit markPrice
+                        'mark_price': float(pos.get('markPrice', pos['entryPrice'])),
+                        'unrealized_pnl': float(pos['unrealizedProfit']),
+                        'leverage': int(pos['leverage'])
+                    })
+            return balance, positions
+
+        elif self.exchange_type == "hyperliquid":
+            user_state = self.exchange['info'].user_state(self.exchange['wallet'])
+            balance = {
+                'total_equity': float(user_state['marginSummary']['accountValue']),
+                'available_balance': float(user_state['withdrawable']),
+                'unrealized_pnl': 0
+            }
+            positions = []
+            for pos in user_state.get('assetPositions', []):
+                positions.append({
+                    'symbol': pos['position']['coin'],
+                    'side': 'long' if float(pos['position']['szi']) > 0 else 'short',
+                    'size': abs(float(pos['position']['szi'])),
+                    'entry_price': float(pos['position']['entryPx']),
+                    'unrealized_pnl': float(pos['position']['unrealizedPnl']),
+                    'leverage': float(pos['position']['leverage']['value'])
+                })
+            return balance, positions
+
+        return self.get_balance(), self.get_positions()
+
+    def _cached(self, key: Tuple, fetch) -> Any:
+        """Serve from the short-TTL REST cache, or fetch and remember"""
+        entry = self._rest_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = fetch()
+        self._rest_cache[key] = (now + _MARKET_DATA_TTL, value)
+        return value
+
     def get_market_price(self, symbol: str) -> float:
         """
-        Get current market price from REAL exchange
+        Get current market price from REAL exchange (TTL-cached, so the
+        re-fetch at execution time inside a cycle is free)
         """
+        return self._cached(('price', symbol), lambda: self._fetch_market_price(symbol))
+
+    def _fetch_market_price(self, symbol: str) -> float:
         if self.exchange_type == "binance":
             ticker = self.exchange.futures_symbol_ticker(symbol=symbol)
             return float(ticker['price'])
@@ -230,10 +434,30 @@ class RealWorldTradingAgent:
             all_mids = self.exchange['info'].all_mids()
             return float(all_mids.get(symbol, 0))
     
+    def get_all_prices(self) -> Dict[str, float]:
+        """
+        Get every symbol's price in ONE exchange call.
+
+        Binance returns all tickers when no symbol is given, and
+        Hyperliquid's all_mids() already carries everything — so fetching
+        N symbols costs one round-trip instead of N.
+        """
+        if self.exchange_type == "binance":
+            tickers = self.exchange.futures_symbol_ticker()
+            return {t['symbol']: float(t['price']) for t in tickers}
+
+        elif self.exchange_type == "hyperliquid":
+            all_mids = self.exchange['info'].all_mids()
+            return {symbol: float(price) for symbol, price in all_mids.items()}
+
     def get_klines(self, symbol: str, interval: str = "1h", limit: int = 100) -> List[Dict[str, Any]]:
         """
-        Get historical klines/candles from REAL exchange
+        Get historical klines/candles from REAL exchange (TTL-cached)
         """
+        return self._cached(('klines', symbol, interval, limit),
+                            lambda: self._fetch_klines(symbol, interval, limit))
+
+    def _fetch_klines(self, symbol: str, interval: str, limit: int) -> List[Dict[str, Any]]:
         if self.exchange_type == "binance":
             klines = self.exchange.futures_klines(
                 symbol=symbol,
@@ -299,9 +523,14 @@ class RealWorldTradingAgent:
         7. Record decision for future analysis
         """
         cycle_number = len(self.decision_history) + 1
-        print(f"\n{'='*80}")
-        print(f"AI Trading Cycle #{cycle_number} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*80}\n")
+        # One wall-clock read per cycle; every consumer (banner, prompts,
+        # decision record) formats this same instant
+        cycle_now = datetime.now()
+        self._cycle_now = cycle_now
+        self._cycle_now_str = cycle_now.strftime('%Y-%m-%d %H:%M:%S')
+        logger.info("\n%s", '=' * 80)
+        logger.info("AI Trading Cycle #%d - %s", cycle_number, self._cycle_now_str)
+        logger.info("%s\n", '=' * 80)
         
         # Default symbols if not provided
         if symbols is None:
@@ -312,52 +541,63 @@ class RealWorldTradingAgent:
         
         try:
             # Step 1: Analyze historical performance
-            print("[STEP 1/7] Analyzing historical performance...")
+            logger.info("[STEP 1/7] Analyzing historical performance...")
             history_analysis = self._analyze_history()
-            print(f"   Completed cycles: {history_analysis['total_cycles']}")
-            print(f"   Win rate: {history_analysis['win_rate']:.1f}%")
-            
-            # Step 2: Get account status from REAL exchange
-            print("\n[STEP 2/7] Fetching account balance from REAL exchange...")
-            balance = self.get_balance()
-            print(f"   Total Equity: ${balance['total_equity']:.2f}")
-            print(f"   Available: ${balance['available_balance']:.2f}")
-            print(f"   Unrealized P/L: ${balance['unrealized_pnl']:.2f}")
-            
-            # Step 3: Get current positions
-            print("\n[STEP 3/7] Fetching current positions...")
-            positions = self.get_positions()
-            print(f"   Active positions: {len(positions)}")
+            logger.info("   Completed cycles: %d", history_analysis['total_cycles'])
+            logger.info("   Win rate: %.1f%%", history_analysis['win_rate'])
+
+            # Step 2: Get account status from REAL exchange (one snapshot
+            # call covers balance AND positions)
+            logger.info("\n[STEP 2/7] Fetching account balance from REAL exchange...")
+            balance, positions = self._fetch_account_snapshot()
+            logger.info("   Total Equity: $%.2f", balance['total_equity'])
+            logger.info("   Available: $%.2f", balance['available_balance'])
+            logger.info("   Unrealized P/L: $%.2f", balance['unrealized_pnl'])
+
+            # Step 3: Current positions (from the same snapshot)
+            logger.info("\n[STEP 3/7] Fetching current positions...")
+            logger.info("   Active positions: %d", len(positions))
             for pos in positions:
-                print(f"   - {pos['symbol']}: {pos['side']} ${pos['size']:.2f} @ ${pos['entry_price']:.2f}")
+                logger.info("   - %s: %s $%.2f @ $%.2f",
+                            pos['symbol'], pos['side'], pos['size'], pos['entry_price'])
             
-            # Step 4: Fetch REAL market data
-            print(f"\n[STEP 4/7] Fetching REAL-TIME market data from internet...")
+            # Step 4: Fetch REAL market data (all symbols concurrently — each
+            # fetch blocks on an HTTPS round-trip, so N symbols cost ~max(RTT)
+            # instead of sum(RTT))
+            logger.info("\n[STEP 4/7] Fetching REAL-TIME market data from internet...")
             market_data = {}
-            for symbol in symbols:
-                try:
-                    price = self.get_market_price(symbol)
-                    klines = self.get_klines(symbol, interval="1h", limit=24)  # Last 24 hours
-                    
-                    # Calculate simple indicators
-                    closes = [k['close'] for k in klines]
-                    sma_24 = sum(closes) / len(closes) if closes else price
-                    
-                    market_data[symbol] = {
-                        'price': price,
-                        'klines': klines[-5:],  # Last 5 candles
-                        'sma_24h': sma_24,
-                        'change_24h': ((price - closes[0]) / closes[0] * 100) if closes else 0
-                    }
-                    
-                    print(f"   [OK] {symbol}: ${price:.2f} ({market_data[symbol]['change_24h']:+.2f}%)")
-                except Exception as e:
-                    print(f"   [FAIL] {symbol}: Failed to fetch data - {e}")
-            
-            # Step 5: Build context and get AI decision
-            print(f"\n[STEP 5/7] Generating AI decision with Chain of Thought...")
+
+            # One batched ticker call covers every symbol's price
+            try:
+                all_prices = self.get_all_prices()
+            except Exception as e:
+                logger.info("   [WARN] Batched price fetch failed, falling back per-symbol: %s", e)
+                all_prices = None
+
+            async def _gather_market_data():
+                return await asyncio.gather(
+                    *[asyncio.to_thread(self._fetch_symbol_data, s, all_prices) for s in symbols],
+                    return_exceptions=True
+                )
+
+            for symbol, outcome in zip(symbols, asyncio.run(_gather_market_data())):
+                if isinstance(outcome, Exception):
+                    logger.info("   [FAIL] %s: Failed to fetch data - %s", symbol, outcome)
+                else:
+                    market_data[symbol] = outcome
+                    logger.info("   [OK] %s: $%.2f (%+.2f%%)",
+                                symbol, outcome['price'], outcome['change_24h'])
+
+            # Step 5: Build context and get AI decision. While the LLM
+            # call is in flight (5-15s), speculatively set leverage on the
+            # most probable symbol so an executing cycle skips that RTT;
+            # if the decision ends up hold or another symbol the extra
+            # call is harmless.
+            if self.exchange_type == "binance" and symbols:
+                self._pool.submit(self._prewarm_leverage, symbols[0], 5)
+            logger.info("\n[STEP 5/7] Generating AI decision with Chain of Thought...")
             if custom_instruction:
-                print(f"   Custom Instruction: {custom_instruction}")
+                logger.info("   Custom Instruction: %s", custom_instruction)
             decision = self._get_ai_decision(
                 cycle_number=cycle_number,
                 history_analysis=history_analysis,
@@ -367,18 +607,17 @@ class RealWorldTradingAgent:
                 custom_instruction=custom_instruction
             )
             
-            print(f"   Decision: {decision['action']}")
+            logger.info("   Decision: %s", decision['action'])
             if decision.get('reasoning'):
-                reasoning_preview = decision['reasoning'][:200]
-                print(f"   Reasoning: {reasoning_preview}...")
-            
+                logger.info("   Reasoning: %s...", decision['reasoning'][:200])
+
             # Step 6: Execute decision on REAL exchange
-            print(f"\n[STEP 6/7] Executing decision on REAL exchange...")
+            logger.info("\n[STEP 6/7] Executing decision on REAL exchange...")
             execution_result = self._execute_decision(decision)
-            print(f"   Execution: {'SUCCESS' if execution_result['success'] else 'FAILED'}")
-            
+            logger.info("   Execution: %s", 'SUCCESS' if execution_result['success'] else 'FAILED')
+
             # Step 7: Record decision
-            print(f"\n[STEP 7/7] Recording decision for future analysis...")
+            logger.info("\n[STEP 7/7] Recording decision for future analysis...")
             self._record_decision(
                 cycle_number=cycle_number,
                 decision=decision,
@@ -386,9 +625,9 @@ class RealWorldTradingAgent:
                 market_data=market_data
             )
             
-            print(f"\n{'='*80}")
-            print(f"Cycle #{cycle_number} Complete")
-            print(f"{'='*80}\n")
+            logger.info("\n%s", '=' * 80)
+            logger.info("Cycle #%d Complete", cycle_number)
+            logger.info("%s\n", '=' * 80)
             
             return {
                 'cycle_number': cycle_number,
@@ -399,71 +638,83 @@ class RealWorldTradingAgent:
             }
             
         except Exception as e:
-            print(f"\n[ERROR] Error in cycle #{cycle_number}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n[ERROR] Error in cycle #%d: %s", cycle_number, e)
             return {
                 'cycle_number': cycle_number,
                 'error': str(e),
                 'success': False
             }
     
+    def _fetch_symbol_data(self, symbol: str,
+                           all_prices: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Fetch price + klines for one symbol and compute simple indicators.
+
+        Thread-safe: run_cycle fans these out with asyncio.to_thread.
+        When a batched all_prices map is supplied, the per-symbol price
+        call is skipped entirely.
+        """
+        if all_prices and symbol in all_prices:
+            price = all_prices[symbol]
+        else:
+            price = self.get_market_price(symbol)
+        klines = self.get_klines(symbol, interval="1h", limit=24)  # Last 24 hours
+
+        # Calculate simple indicators on a columnar close array; future TA
+        # (RSI/EMA/MACD) can consume the same array without re-extraction
+        closes = np.asarray([k['close'] for k in klines], dtype=np.float32)
+        sma_24 = float(sma(closes, 24)) if closes.size else price
+
+        return {
+            'price': price,
+            'klines': klines[-5:],  # Last 5 candles
+            'closes': closes,
+            'sma_24h': sma_24,
+            'change_24h': float((price - closes[0]) / closes[0] * 100) if closes.size else 0
+        }
+
     def _analyze_history(self) -> Dict[str, Any]:
         """
-        Analyze last 20 decision cycles for performance
+        Analyze last 20 decision cycles for performance.
+
+        O(1): the 20-cycle window and its win counter are maintained
+        incrementally by _record_decision, so no rescan of the history
+        list happens per cycle.
         """
-        recent_history = self.decision_history[-20:] if len(self.decision_history) > 0 else []
-        
-        total_cycles = len(recent_history)
-        winning_cycles = sum(1 for h in recent_history if h.get('execution', {}).get('success'))
+        total_cycles = len(self._win_window)
+        winning_cycles = self._wins_in_window
         win_rate = (winning_cycles / total_cycles * 100) if total_cycles > 0 else 0
-        
+
         return {
             'total_cycles': total_cycles,
             'winning_cycles': winning_cycles,
             'win_rate': win_rate,
-            'recent_decisions': recent_history[-5:] if recent_history else []
+            'recent_decisions': self.decision_history[-5:] if self.decision_history else []
         }
     
     def _build_system_prompt(self, history_analysis: Dict[str, Any]) -> str:
         """
-        Build system prompt for AI
+        Build system prompt for AI (memoized — the text only changes when
+        the performance counters do, which is at most once per cycle)
         """
-        return f"""You are a professional cryptocurrency futures trader operating on {self.exchange_type.upper()}.
-
-TRADING RULES:
-1. **Risk Management**: Never risk more than 2-5% of account per trade
-2. **Position Sizing**: Scale positions based on confidence and volatility
-3. **Trading Frequency**: Excellent traders make 2-4 trades per day (not every cycle)
-4. **Performance Awareness**: Your recent win rate is {history_analysis['win_rate']:.1f}%
-
-HISTORICAL PERFORMANCE:
-- Total cycles completed: {history_analysis['total_cycles']}
-- Winning cycles: {history_analysis['winning_cycles']}
-- Win rate: {history_analysis['win_rate']:.1f}%
-
-OUTPUT FORMAT:
-You MUST respond with:
-<reasoning>
-[Your detailed Chain of Thought analysis here]
-- Current market conditions
-- Account state analysis
-- Risk assessment
-- Decision rationale
-</reasoning>
-
-<decision>
-{{
-  "action": "open_long" | "open_short" | "close_position" | "hold",
-  "symbol": "BTCUSDT" (or null if hold),
-  "size_usd": 100.0 (or null if hold),
-  "leverage": 5 (or null if hold),
-  "reason": "Brief reason for this decision"
-}}
-</decision>
+        key = (
+            history_analysis['win_rate'],
+            history_analysis['total_cycles'],
+            history_analysis['winning_cycles'],
+        )
+        if self._sys_prompt_cache is not None and self._sys_prompt_cache[0] == key:
+            return self._sys_prompt_cache[1]
+        prompt = self._render_system_prompt(history_analysis)
+        self._sys_prompt_cache = (key, prompt)
+        return prompt
 
-Think carefully before trading. Not every cycle requires action.
-"""
+    def _render_system_prompt(self, history_analysis: Dict[str, Any]) -> str:
+        return _SYSTEM_TMPL.format_map({
+            'exchange': self.exchange_type.upper(),
+            'win_rate': history_analysis['win_rate'],
+            'total_cycles': history_analysis['total_cycles'],
+            'winning_cycles': history_analysis['winning_cycles'],
+        })
     
     def _build_user_prompt(
         self,
@@ -476,17 +727,10 @@ Think carefully before trading. Not every cycle requires action.
         """
         Build user prompt with current data
         """
-        positions_str = "\n".join([
-            f"  - {p['symbol']}: {p['side']} ${p['size']:.2f} @ ${p['entry_price']:.2f} (P/L: ${p['unrealized_pnl']:.2f})"
-            for p in positions
-        ]) if positions else "  No active positions"
-        
-        market_str = "\n".join([
-            f"  - {symbol}: ${data['price']:.2f} (24h: {data['change_24h']:+.2f}%, SMA: ${data['sma_24h']:.2f})"
-            for symbol, data in market_data.items()
-        ])
-        
-        base_prompt = f"""CYCLE #{cycle_number} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        # Assemble into a single StringIO buffer: one final str build
+        # instead of repeated immutable-string concatenations
+        buf = io.StringIO()
+        buf.write(f"""CYCLE #{cycle_number} - {self._cycle_now_str}
 
 ACCOUNT STATUS:
   Total Equity: ${balance['total_equity']:.2f}
@@ -494,25 +738,39 @@ ACCOUNT STATUS:
   Unrealized P/L: ${balance['unrealized_pnl']:+.2f}
 
 CURRENT POSITIONS:
-{positions_str}
+""")
+        if positions:
+            for p in positions:
+                buf.write(f"  - {p['symbol']}: {p['side']} ${p['size']:.2f} @ ${p['entry_price']:.2f} (P/L: ${p['unrealized_pnl']:.2f})\n")
+        else:
+            buf.write("  No active positions\n")
+
+        buf.write("\nMARKET DATA (REAL-TIME):\n")
+        if market_data:
+            # Columnar render: one DataFrame + vectorized row formatting
+            # scales better than a Python f-string per symbol as the
+            # watchlist grows
+            df = pd.DataFrame.from_dict(market_data, orient='index')
+            market_str = df.apply(
+                lambda r: f"  - {r.name}: ${r['price']:.2f} (24h: {r['change_24h']:+.2f}%, SMA: ${r['sma_24h']:.2f})",
+                axis=1
+            ).str.cat(sep='\n')
+            buf.write(market_str)
+            buf.write('\n')
 
-MARKET DATA (REAL-TIME):
-{market_str}
-"""
-        
         # Add custom instruction if provided
         if custom_instruction:
-            base_prompt += f"""
+            buf.write(f"""
 
 CUSTOM INSTRUCTION FROM USER:
 {custom_instruction}
 
 Please follow this instruction while making your trading decision.
-"""
-        
-        base_prompt += "\nWhat is your trading decision for this cycle?"
-        
-        return base_prompt
+""")
+
+        buf.write("\nWhat is your trading decision for this cycle?")
+
+        return buf.getvalue()
     
     def _get_ai_decision(
         self,
@@ -539,11 +797,28 @@ Please follow this instruction while making your trading decision.
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=2000,
+                stream=True
             )
-            
-            ai_response = response.choices[0].message.content
-            
+
+            # Stream tokens and stop as soon as the closing decision tag
+            # arrives — no need to wait out trailing commentary
+            parts = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                # The tag can span chunks; only re-join when a '>' shows up
+                if '>' in delta and '</decision>' in ''.join(parts[-8:]):
+                    try:
+                        response.close()
+                    except Exception:
+                        pass
+                    break
+
+            ai_response = ''.join(parts)
+
             # Parse response to extract reasoning and decision
             return self._parse_ai_response(ai_response)
             
@@ -561,17 +836,19 @@ Please follow this instruction while making your trading decision.
         Parse AI response to extract reasoning and decision
         """
         # Extract reasoning
-        reasoning_match = re.search(r'<reasoning>(.*?)</reasoning>', response, re.DOTALL)
+        reasoning_match = _REASONING_RE.search(response)
         reasoning = reasoning_match.group(1).strip() if reasoning_match else "No reasoning provided"
-        
+
         # Extract decision JSON
-        decision_match = re.search(r'<decision>(.*?)</decision>', response, re.DOTALL)
+        decision_match = _DECISION_RE.search(response)
         if decision_match:
             try:
-                decision_json = json.loads(decision_match.group(1).strip())
+                raw = decision_match.group(1).strip()
+                # orjson decodes 2-5x faster than stdlib json when available
+                decision_json = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 decision_json['reasoning'] = reasoning
                 return decision_json
-            except json.JSONDecodeError:
+            except ValueError:
                 return {
                     'action': 'hold',
                     'symbol': None,
@@ -613,19 +890,59 @@ Please follow this instruction while making your trading decision.
                 'error': str(e)
             }
     
+    def _quantity_precision(self, symbol: str) -> int:
+        """
+        Decimal places allowed for order quantity on `symbol`.
+
+        Loaded once for ALL symbols from futures_exchange_info() LOT_SIZE
+        filters; the previous hardcoded round(_, 3) rejected orders on
+        symbols with coarser step sizes.
+        """
+        if self._step_precision is None:
+            precisions = {}
+            try:
+                info = self.exchange.futures_exchange_info()
+                for sym in info.get('symbols', []):
+                    for f in sym.get('filters', []):
+                        if f.get('filterType') == 'LOT_SIZE':
+                            step = float(f['stepSize'])
+                            precisions[sym['symbol']] = max(0, int(round(-math.log10(step))))
+                            break
+            except Exception as e:
+                print(f"   [WARN] Could not load exchange precision info: {e}")
+            self._step_precision = precisions
+        return self._step_precision.get(symbol, 3)
+
+    def _prewarm_leverage(self, symbol: str, leverage: int):
+        """Background leverage set; failures only cost the speculation"""
+        try:
+            self._ensure_leverage(symbol, leverage)
+        except Exception as e:
+            logger.info("   [WARN] Leverage prewarm failed for %s: %s", symbol, e)
+
+    def _ensure_leverage(self, symbol: str, leverage: int):
+        """Set leverage only when it differs from what we last set.
+
+        futures_change_leverage is a signed write call (~100ms plus order
+        weight); repeating it with the same value every trade is wasted.
+        """
+        if self._leverage_cache.get(symbol) != leverage:
+            self.exchange.futures_change_leverage(symbol=symbol, leverage=leverage)
+            self._leverage_cache[symbol] = leverage
+
     def _execute_binance(self, action: str, symbol: str, size_usd: float, leverage: int) -> Dict[str, Any]:
         """Execute trade on Binance"""
-        # Set leverage
-        self.exchange.futures_change_leverage(symbol=symbol, leverage=leverage)
+        # Set leverage (skipped when already at the requested value)
+        self._ensure_leverage(symbol, leverage)
         
         # Get current price
         price = self.get_market_price(symbol)
         
         # Calculate quantity (size in contracts)
         quantity = size_usd / price
-        
-        # Round to valid precision (simplified - should check symbol info)
-        quantity = round(quantity, 3)
+
+        # Round to the symbol's real LOT_SIZE precision
+        quantity = round(quantity, self._quantity_precision(symbol))
         
         # Place market order
         if action == "open_long":
@@ -701,18 +1018,54 @@ Please follow this instruction while making your trading decision.
         market_data: Dict[str, Any]
     ):
         """
-        Record decision for future analysis
+        Record decision for future analysis.
+
+        Only the scalar market snapshot is kept per symbol — storing raw
+        klines (and the close arrays) made long sessions grow by tens of
+        KB per cycle and nothing downstream reads them from the record.
         """
-        record = {
-            'cycle_number': cycle_number,
-            'timestamp': datetime.now().isoformat(),
-            'decision': decision,
-            'execution': execution_result,
-            'market_data': market_data
+        market_snapshot = {
+            symbol: {
+                'price': data.get('price'),
+                'sma_24h': data.get('sma_24h'),
+                'change_24h': data.get('change_24h')
+            }
+            for symbol, data in market_data.items()
         }
-        
+        record = DecisionRecord(
+            cycle_number=cycle_number,
+            timestamp=self._cycle_now.isoformat(),
+            action=decision.get('action', 'hold'),
+            symbol=decision.get('symbol'),
+            size_usd=decision.get('size_usd'),
+            leverage=decision.get('leverage'),
+            success=bool(execution_result.get('success')),
+            reasoning=decision.get('reasoning', ''),
+            execution=execution_result,
+            market_data=market_snapshot
+        )
+
         self.decision_history.append(record)
-        
-        # Optionally save to file
-        # with open(f'decisions_{self.name}.json', 'w') as f:
-        #     json.dump(self.decision_history, f, indent=2)
+
+        # Maintain the rolling 20-cycle win window incrementally
+        if len(self._win_window) == self._win_window.maxlen:
+            self._wins_in_window -= self._win_window[0]
+        won = 1 if execution_result.get('success') else 0
+        self._win_window.append(won)
+        self._wins_in_window += won
+
+        # Opt-in persistence: append the ONE new record as an NDJSON line
+        # instead of rewriting the whole history file every cycle
+        if self.persist_decisions:
+            try:
+                payload = asdict(record)
+                if ORJSON_AVAILABLE:
+                    line = orjson.dumps(payload, default=str) + b'\n'
+                    mode = 'ab'
+                else:
+                    line = json.dumps(payload, default=str) + '\n'
+                    mode = 'a'
+                with open(self._decisions_path, mode) as f:
+                    f.write(line)
+            except Exception as e:
+                logger.info("   [WARN] Could not persist decision: %s", e)
@@ -3,22 +3,225 @@ Simulated trading account for backtesting.
 Provides realistic exchange behavior simulation with fees, slippage, and leverage.
 """
 import math
+import numpy as np
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+
+from .indicators import njit
+
+# Hot-path scalar kernels, pulled out of the class so numba can compile
+# them to native code (they run as plain Python when numba is absent).
+# All of them take an integer side sign (+1 long / -1 short) instead of
+# the string side, so there is no string compare in the inner math.
+# cache=True persists the compiled code on disk, so the JIT cost is paid
+# once per machine, not per process; compile_numba.py warms everything
+# ahead of time (e.g. in CI before the test suite).
+
+
+@njit(cache=True, fastmath=True)
+def _slippage_nb(price: float, rate: float, open_sign: int) -> float:
+    """Branchless slippage: open_sign = +1 pushes price up, -1 down"""
+    return price + price * rate * open_sign
+
+
+@njit(cache=True, fastmath=True)
+def _liquidation_nb(entry: float, leverage: int, side_sign: int, mm_rate: float) -> float:
+    if leverage <= 0:
+        return 0.0
+    if mm_rate < 0.0:
+        mm_rate = 0.0
+    base_move = 1.0 / leverage
+    return entry * (1.0 - side_sign * base_move) / max(1e-6, 1.0 - mm_rate)
+
+
+@njit(cache=True, fastmath=True)
+def _pnl_nb(entry: float, price: float, qty: float, side_sign: int) -> float:
+    """Realized or unrealized PnL for `qty` at `price` against `entry`"""
+    return (price - entry) * side_sign * qty
+
+
+# Prefer a compiled kernel build when one exists: the numba-AOT module
+# (see _backtest_kernels_aot.py) first, then the Cython extension
+# (backtest_account_fast.pyx, built via `cythonize -i`). Both carry the
+# same math with zero per-process warmup; otherwise the @njit/pure-
+# Python kernels above are used.
+KERNELS_BACKEND = 'python'
+try:
+    from .backtest_kernels import (
+        apply_slippage as _slippage_nb,
+        compute_liquidation as _liquidation_nb,
+        pnl as _pnl_nb,
+    )
+    KERNELS_BACKEND = 'numba-aot'
+except ImportError:
+    try:
+        from .backtest_account_fast import (
+            apply_slippage as _slippage_nb,
+            compute_liquidation as _liquidation_nb,
+            pnl as _pnl_nb,
+        )
+        KERNELS_BACKEND = 'cython'
+    except ImportError:
+        pass
+
+
+# Structured dtypes for the batch fill API: one contiguous array in, one
+# out, so tight backtest drivers pay the method-call cost once per batch
+ORDER_DTYPE = np.dtype([
+    ('symbol_id', 'i4'),
+    ('side_sign', 'i1'),   # +1 long / -1 short
+    ('qty', 'f8'),
+    ('price', 'f8'),
+    ('leverage', 'i4'),    # used on opens; ignored on closes
+    ('ts', 'i8'),
+    ('is_open', 'i1'),     # 1 = open/add, 0 = close
+])
+
+FILL_RESULT_DTYPE = np.dtype([
+    ('pnl', 'f8'),
+    ('fee', 'f8'),
+    ('exec_price', 'f8'),
+    ('error', 'i1'),       # 0 = ok, 1 = rejected
+])
+
+# Every accepted fill is appended to a preallocated structured array
+# (see BacktestAccount.trade_log) instead of a Python list of tuples —
+# contiguous writes, no per-event object, and downstream analytics get
+# a zero-copy view for numpy/pandas
+TRADE_LOG_DTYPE = np.dtype([
+    ('ts', 'i8'),
+    ('sym_id', 'i4'),
+    ('side', 'i1'),        # +1 long / -1 short
+    ('qty', 'f8'),
+    ('price', 'f8'),       # execution price after slippage
+    ('fee', 'f8'),
+    ('pnl', 'f8'),         # realized pnl (0.0 on opens)
+])
+
+
+# Float-comparison tolerance as a module constant: LOAD_GLOBAL beats the
+# class->instance attribute chain self.EPSILON costs on every order
+_EPS = 1e-8
+
+# Error messages as module constants (string literals, so the rejection
+# paths return shared objects rather than allocating)
+_ERR_QTY_TOO_SMALL = "quantity too small"
+_ERR_INSUFFICIENT = "insufficient balance"
+_ERR_NO_POSITION = "no position found"
+_ERR_BAD_QTY = "invalid quantity"
+
+
+class OpenResult:
+    """
+    Reusable result of BacktestAccount.open.
+
+    One instance lives per account and is overwritten by each call —
+    unpack or copy the fields before issuing the next order. Iterable,
+    so the historical `pos, fee, exec_price, err = account.open(...)`
+    destructuring keeps working without a fresh tuple per call.
+    """
+    __slots__ = ('pos', 'fee', 'exec_price', 'error')
+
+    def set(self, pos, fee, exec_price, error):
+        self.pos = pos
+        self.fee = fee
+        self.exec_price = exec_price
+        self.error = error
+        return self
+
+    def __iter__(self):
+        return iter((self.pos, self.fee, self.exec_price, self.error))
+
+
+class CloseResult:
+    """Reusable result of BacktestAccount.close; same contract as OpenResult"""
+    __slots__ = ('pnl', 'fee', 'exec_price', 'error')
+
+    def set(self, pnl, fee, exec_price, error):
+        self.pnl = pnl
+        self.fee = fee
+        self.exec_price = exec_price
+        self.error = error
+        return self
+
+    def __iter__(self):
+        return iter((self.pnl, self.fee, self.exec_price, self.error))
 
 
-@dataclass
 class Position:
-    """Represents an open position in the simulated account"""
-    symbol: str
-    side: str  # 'long' or 'short'
-    quantity: float
-    entry_price: float
-    leverage: int
-    margin: float
-    notional: float
-    liquidation_price: float
-    open_time: int
+    """
+    Represents an open position in the simulated account.
+
+    A __slots__ class rather than a dataclass: attribute access is a
+    fixed-offset load, each instance drops the per-object __dict__, and
+    the side lives as an integer sign (+1 long / -1 short) so the PnL
+    math never compares strings. `side` remains available as a property
+    for existing callers.
+    """
+    __slots__ = ('symbol', 'side_sign', 'quantity', 'entry_price', 'leverage',
+                 'inv_leverage', 'margin', 'margin_per_unit',
+                 '_liq_price', '_liq_dirty', '_mm_rate', 'open_time', 'row')
+
+    def __init__(self, symbol: str, side: str, quantity: float, entry_price: float,
+                 leverage: int, margin: float,
+                 liquidation_price: float, open_time: int, row: int = -1):
+        self.symbol = symbol
+        self.side_sign = 1 if side == 'long' else -1
+        self.quantity = quantity
+        self.entry_price = entry_price
+        self.leverage = leverage
+        self.inv_leverage = 1.0 / leverage if leverage else 1.0
+        self.margin = margin
+        self.margin_per_unit = 0.0
+        self._liq_price = liquidation_price
+        self._liq_dirty = False
+        self._mm_rate = 0.0
+        self.open_time = open_time
+        self.row = row
+
+    @property
+    def side(self) -> str:
+        """String side for display and backward compatibility"""
+        return 'long' if self.side_sign > 0 else 'short'
+
+    @property
+    def notional(self) -> float:
+        """
+        Position notional, derived on demand. Was a stored field that
+        open/close kept in sync with two float stores per order, but it
+        always equals quantity * entry_price by construction.
+        """
+        return self.quantity * self.entry_price
+
+    @property
+    def liquidation_price(self) -> float:
+        """
+        Liquidation price, computed lazily.
+
+        open() only marks the position dirty instead of recomputing on
+        every fill; the price is derived on first read and cached until
+        the next fill. Strategies that never consult it per order pay
+        nothing.
+        """
+        if self._liq_dirty:
+            self._liq_price = _liquidation_nb(
+                self.entry_price, self.leverage, self.side_sign, self._mm_rate
+            )
+            self._liq_dirty = False
+        return self._liq_price
+
+    @liquidation_price.setter
+    def liquidation_price(self, value: float):
+        self._liq_price = value
+        self._liq_dirty = False
+
+    def force_compute_liquidation(self) -> float:
+        """Explicit prefetch for callers that want the value hot per tick"""
+        return self.liquidation_price
+
+    def __repr__(self):
+        return (f"Position(symbol={self.symbol!r}, side={self.side!r}, "
+                f"quantity={self.quantity}, entry_price={self.entry_price}, "
+                f"leverage={self.leverage}, margin={self.margin})")
 
 
 class BacktestAccount:
@@ -27,7 +230,7 @@ class BacktestAccount:
     Supports long/short positions with leverage, fees, slippage, and liquidation.
     """
     
-    EPSILON = 1e-8  # For float comparisons
+    EPSILON = _EPS  # For float comparisons (kept for external callers)
     
     def __init__(
         self,
@@ -53,8 +256,139 @@ class BacktestAccount:
         self.maker_fee_rate = (maker_fee_bps / 10000.0) if maker_fee_bps is not None else self.taker_fee_rate
         self.slippage_rate = slippage_bps / 10000.0
         self.maintenance_margin_rate = maintenance_margin_rate
-        self.positions: Dict[str, Position] = {}  # key: "SYMBOL:side"
+        self.positions: Dict[int, Position] = {}  # key: (sym_id << 1) | side_bit
+        self.realized_pnl = 0.0
+
+        # Struct-of-Arrays mirror of the open positions, kept in sync on
+        # open/close so mark-to-market runs as one vectorized NumPy pass
+        # instead of a Python loop over Position objects
+        self._capacity = 16
+        self._entry = np.zeros(self._capacity)
+        self._qty = np.zeros(self._capacity)
+        self._margin_arr = np.zeros(self._capacity)
+        self._sign = np.zeros(self._capacity, dtype=np.int8)
+        self._row_sym_idx = np.zeros(self._capacity, dtype=np.int32)
+        self._row_keys: List[str] = []
+        self._row_symbols: List[str] = []
+        self._n_active = 0
+
+        # Symbol interning for the batch API: small stable int ids
+        self._sym_ids: Dict[str, int] = {}
+        self._id_sym: List[str] = []
+
+        # Reusable result carriers (one allocation per account, not per
+        # order); both iterate like the old 4-tuples
+        self._open_result = OpenResult()
+        self._close_result = CloseResult()
+
+        # Structured trade log, grown geometrically; one row per
+        # accepted fill, written by index
+        self.trade_log = np.zeros(256, dtype=TRADE_LOG_DTYPE)
+        self._log_idx = 0
+
+    def reset(self, initial_balance: float = None):
+        """
+        Restore the account to its initial state in place.
+
+        Cheaper than building a new account for every scenario: the SoA
+        buffers, interned symbol ids and trade-log allocation are kept
+        as warm capacity, and any compiled kernels stay warm with them.
+        """
+        if initial_balance is not None:
+            self.initial_balance = initial_balance
+        self.cash = self.initial_balance
+        self.positions.clear()
         self.realized_pnl = 0.0
+        self._n_active = 0
+        self._row_keys.clear()
+        self._row_symbols.clear()
+        self._log_idx = 0
+
+    def intern_symbol(self, symbol: str) -> int:
+        """Map a symbol to a stable small integer id (creates on first use)"""
+        symbol = symbol.upper()
+        sid = self._sym_ids.get(symbol)
+        if sid is None:
+            sid = len(self._id_sym)
+            self._sym_ids[symbol] = sid
+            self._id_sym.append(symbol)
+        return sid
+
+    def batch_apply(self, orders: np.ndarray) -> np.ndarray:
+        """
+        Apply many fills in one call.
+
+        Args:
+            orders: structured array with ORDER_DTYPE fields; symbol_id
+                    comes from intern_symbol(), side_sign is +1/-1 and
+                    is_open selects open-or-add vs close.
+
+        Returns:
+            Structured array (FILL_RESULT_DTYPE) of per-fill outcomes.
+
+        The driver loop stays in Python because the Position objects are
+        authoritative, but callers amortize their per-order dispatch and
+        all results land in one contiguous buffer for vectorized
+        analytics downstream.
+        """
+        results = np.zeros(len(orders), dtype=FILL_RESULT_DTYPE)
+        id_sym = self._id_sym
+        _open = self.open
+        _close = self.close
+
+        for i in range(len(orders)):
+            o = orders[i]
+            symbol = id_sym[o['symbol_id']]
+            side = 'long' if o['side_sign'] > 0 else 'short'
+            if o['is_open']:
+                pos, fee, exec_price, err = _open(
+                    symbol, side, float(o['qty']), int(o['leverage']),
+                    float(o['price']), int(o['ts'])
+                )
+                results[i] = (0.0, fee, exec_price, 0 if err is None else 1)
+            else:
+                pnl, fee, exec_price, err = _close(
+                    symbol, side, float(o['qty']), float(o['price'])
+                )
+                results[i] = (pnl, fee, exec_price, 0 if err is None else 1)
+        return results
+
+    def _log_fill(self, ts: int, sym_id: int, side_sign: int,
+                  qty: float, price: float, fee: float, pnl: float):
+        """Append one row to the trade log, doubling the buffer when full"""
+        idx = self._log_idx
+        if idx == self.trade_log.shape[0]:
+            grown = np.zeros(idx * 2, dtype=TRADE_LOG_DTYPE)
+            grown[:idx] = self.trade_log
+            self.trade_log = grown
+        self.trade_log[idx] = (ts, sym_id, side_sign, qty, price, fee, pnl)
+        self._log_idx = idx + 1
+
+    def get_trade_log_view(self) -> np.ndarray:
+        """Zero-copy view of the fills recorded so far (TRADE_LOG_DTYPE)"""
+        return self.trade_log[:self._log_idx]
+
+    def _grow_soa(self):
+        """Double the SoA buffers when full"""
+        self._capacity *= 2
+        for name in ('_entry', '_qty', '_margin_arr'):
+            old = getattr(self, name)
+            buf = np.zeros(self._capacity, dtype=old.dtype)
+            buf[:old.shape[0]] = old
+            setattr(self, name, buf)
+        sign = np.zeros(self._capacity, dtype=np.int8)
+        sign[:self._sign.shape[0]] = self._sign
+        self._sign = sign
+        sym_idx = np.zeros(self._capacity, dtype=np.int32)
+        sym_idx[:self._row_sym_idx.shape[0]] = self._row_sym_idx
+        self._row_sym_idx = sym_idx
+
+    def _sync_row(self, pos: Position):
+        """Mirror a Position's mutable fields into its SoA row"""
+        row = pos.row
+        self._entry[row] = pos.entry_price
+        self._qty[row] = pos.quantity
+        self._margin_arr[row] = pos.margin
     
     def set_fee_mode(self, maker_fee_bps: float = None, taker_fee_bps: float = None):
         """Update fee config at runtime."""
@@ -63,10 +397,23 @@ class BacktestAccount:
         if taker_fee_bps is not None:
             self.taker_fee_rate = taker_fee_bps / 10000.0
     
-    @staticmethod
-    def _position_key(symbol: str, side: str) -> str:
-        """Generate unique key for position"""
-        return f"{symbol.upper()}:{side}"
+    def _position_key(self, symbol: str, side: str) -> int:
+        """
+        Unique key for a position: the interned symbol id bit-packed with
+        the side. An int key hashes in one cycle and allocates nothing,
+        unlike the old f"SYMBOL:side" string built per call. (A
+        (symbol, side) tuple key would also beat the f-string, but the
+        packed int skips even the tuple allocation and hash combine.)
+
+        `symbol` must already be canonical (uppercased once at the API
+        boundary) so no new string is allocated here.
+        """
+        sid = self._sym_ids.get(symbol)
+        if sid is None:
+            sid = len(self._id_sym)
+            self._sym_ids[symbol] = sid
+            self._id_sym.append(symbol)
+        return (sid << 1) | (0 if side == 'long' else 1)
     
     def _ensure_position(self, symbol: str, side: str) -> Position:
         """Get or create position"""
@@ -74,25 +421,59 @@ class BacktestAccount:
         if key in self.positions:
             return self.positions[key]
         
+        if self._n_active == self._capacity:
+            self._grow_soa()
+
+        row = self._n_active
         pos = Position(
-            symbol=symbol.upper(),
+            symbol=symbol,
             side=side,
             quantity=0.0,
             entry_price=0.0,
             leverage=1,
             margin=0.0,
-            notional=0.0,
             liquidation_price=0.0,
-            open_time=0
+            open_time=0,
+            row=row
         )
         self.positions[key] = pos
+        self._sign[row] = pos.side_sign
+        self._row_sym_idx[row] = key >> 1
+        # Display key ("SYMBOL:side") built once per position, only for
+        # the per-position PnL dict returned to user code
+        self._row_keys.append(f"{pos.symbol}:{side}")
+        self._row_symbols.append(pos.symbol)
+        self._n_active += 1
         return pos
-    
+
     def _remove_position(self, pos: Position):
-        """Remove position from account"""
-        key = self._position_key(pos.symbol, pos.side)
-        if key in self.positions:
-            del self.positions[key]
+        """Remove position from account (swap-with-tail in the SoA)"""
+        self._remove_position_by_key(self._position_key(pos.symbol, pos.side))
+
+    def _remove_position_by_key(self, key: int):
+        """Remove a position whose packed key is already in hand"""
+        pos = self.positions.pop(key, None)
+        if pos is None:
+            return
+
+        row = pos.row
+        last = self._n_active - 1
+        if row != last:
+            # Move the tail row into the freed slot; its packed key is
+            # reconstructed from the SoA columns (sym id + sign), not
+            # re-derived through the symbol dict
+            moved_key = (int(self._row_sym_idx[last]) << 1) | (0 if self._sign[last] > 0 else 1)
+            self._entry[row] = self._entry[last]
+            self._qty[row] = self._qty[last]
+            self._margin_arr[row] = self._margin_arr[last]
+            self._sign[row] = self._sign[last]
+            self._row_sym_idx[row] = self._row_sym_idx[last]
+            self._row_keys[row] = self._row_keys[last]
+            self._row_symbols[row] = self._row_symbols[last]
+            self.positions[moved_key].row = row
+        self._row_keys.pop()
+        self._row_symbols.pop()
+        self._n_active = last
     
     def open(
         self,
@@ -103,7 +484,7 @@ class BacktestAccount:
         price: float,
         timestamp: int,
         is_maker: bool = False,
-    ) -> Tuple[Optional[Position], float, float, Optional[str]]:
+    ) -> OpenResult:
         """
         Open a new position or add to existing position.
         
@@ -116,62 +497,71 @@ class BacktestAccount:
             timestamp: Unix timestamp
             
         Returns:
-            (position, fee, execution_price, error)
+            OpenResult, unpackable as (position, fee, execution_price, error)
         """
-        if quantity <= self.EPSILON:
-            return None, 0.0, 0.0, "quantity too small"
-        
+        if quantity <= _EPS:
+            return self._open_result.set(None, 0.0, 0.0, _ERR_QTY_TOO_SMALL)
+
         if leverage < 1:
             leverage = 1
-        
+
+        # Canonicalize exactly once; everything downstream assumes it
+        symbol = symbol.upper()
         pos = self._ensure_position(symbol, side)
-        
-        # Apply slippage to execution price
-        exec_price = self._apply_slippage(price, self.slippage_rate, side, is_open=True)
-        
-        # Calculate order value and costs
+
+        # Branchless slippage: opening executes against you (+1 long,
+        # -1 short) — one FMA, no string compare. The sign was resolved
+        # once when the Position was created; every helper downstream
+        # takes the int, never the string.
+        exec_price = _slippage_nb(price, self.slippage_rate, pos.side_sign)
+
+        # Calculate order value and costs (divide by leverage once, then
+        # multiply everywhere — float division is the slow operation here).
+        # Rates are bound to locals so the arithmetic runs on LOAD_FAST.
+        inv_leverage = 1.0 / leverage
         order_value = quantity * exec_price
         fee_rate = self.maker_fee_rate if is_maker else self.taker_fee_rate
         fee = order_value * fee_rate
-        margin_needed = order_value / leverage
+        margin_needed = order_value * inv_leverage
         total_cost = margin_needed + fee
-        
+
         # Check if sufficient cash
         if total_cost > self.cash:
-            return None, 0.0, 0.0, "insufficient balance"
-        
+            return self._open_result.set(None, 0.0, 0.0, _ERR_INSUFFICIENT)
+
         # Deduct costs
         self.cash -= total_cost
         self.realized_pnl -= fee  # Fees are realized losses
-        
-        # Update position
-        if pos.quantity < self.EPSILON:
-            # New position
-            pos.quantity = quantity
-            pos.entry_price = exec_price
+
+        # Update position. The weighted-average entry also covers the
+        # fresh slot: with quantity == entry_price == 0 it reduces to
+        # exec_price, so new-vs-add no longer needs two code paths.
+        is_new = pos.quantity < _EPS
+        total_qty = pos.quantity + quantity
+        pos.entry_price = (pos.quantity * pos.entry_price + quantity * exec_price) / total_qty
+        pos.quantity = total_qty
+        pos.margin += margin_needed
+        if is_new:
             pos.leverage = leverage
-            pos.margin = margin_needed
-            pos.notional = order_value
+            pos.inv_leverage = inv_leverage
             pos.open_time = timestamp
-        else:
-            # Adding to existing position - calculate new weighted average
-            total_qty = pos.quantity + quantity
-            total_cost = (pos.quantity * pos.entry_price) + (quantity * exec_price)
-            new_entry = total_cost / total_qty
-            
-            pos.quantity = total_qty
-            pos.entry_price = new_entry
-            pos.margin += margin_needed
-            pos.notional += order_value
-            # Keep same leverage
-        
-        # Calculate liquidation price with maintenance margin
-        pos.liquidation_price = self._compute_liquidation(
-            pos.entry_price, pos.leverage, pos.side, self.maintenance_margin_rate
-        )
-        
-        return pos, fee, exec_price, None
-    
+        # else: keep same leverage
+
+
+        # Margin per unit only changes on opens; close then returns
+        # margin with one multiply instead of a ratio division
+        pos.margin_per_unit = pos.margin / pos.quantity
+
+        # Liquidation price goes stale rather than being recomputed per
+        # fill; the Position property derives it lazily on first read
+        pos._mm_rate = self.maintenance_margin_rate
+        pos._liq_dirty = True
+
+        self._sync_row(pos)
+        self._log_fill(timestamp, int(self._row_sym_idx[pos.row]), pos.side_sign,
+                       quantity, exec_price, fee, 0.0)
+        return self._open_result.set(pos, fee, exec_price, None)
+
     def close(
         self,
         symbol: str,
@@ -179,31 +569,63 @@ class BacktestAccount:
         quantity: float,
         price: float,
         is_maker: bool = False,
-    ) -> Tuple[float, float, float, Optional[str]]:
+        timestamp: int = 0,
+    ) -> CloseResult:
         """
         Close a position (partially or fully).
-        
+
         Args:
             symbol: Trading pair
             side: 'long' or 'short'
             quantity: Amount to close
             price: Market price
-            
+            timestamp: Unix timestamp recorded in the trade log
+
         Returns:
-            (realized_pnl, fee, execution_price, error)
+            CloseResult, unpackable as (realized_pnl, fee, execution_price, error)
         """
-        key = self._position_key(symbol, side)
-        if key not in self.positions:
-            return 0.0, 0.0, 0.0, "no position found"
-        
-        pos = self.positions[key]
-        
-        if quantity <= self.EPSILON or quantity > pos.quantity + self.EPSILON:
-            return 0.0, 0.0, 0.0, "invalid quantity"
-        
-        # Apply slippage to execution price
-        exec_price = self._apply_slippage(price, self.slippage_rate, side, is_open=False)
-        
+        key = self._position_key(symbol.upper(), side)
+        pos = self.positions.get(key)
+        if pos is None:
+            return self._close_result.set(0.0, 0.0, 0.0, _ERR_NO_POSITION)
+        return self._close_resolved(pos, key, quantity, price, is_maker, timestamp)
+
+    def close_position(
+        self,
+        pos: Position,
+        quantity: float,
+        price: float,
+        is_maker: bool = False,
+        timestamp: int = 0,
+    ) -> CloseResult:
+        """
+        Close against an already-resolved Position.
+
+        Strategies that hold Position references (e.g. from
+        get_positions()) skip the symbol/side lookup entirely; the packed
+        key is rebuilt from the position's own fields only so the final
+        dict delete still works.
+        """
+        key = (self._sym_ids[pos.symbol] << 1) | (0 if pos.side_sign > 0 else 1)
+        return self._close_resolved(pos, key, quantity, price, is_maker, timestamp)
+
+    def _close_resolved(
+        self,
+        pos: Position,
+        key: int,
+        quantity: float,
+        price: float,
+        is_maker: bool,
+        timestamp: int = 0,
+    ) -> CloseResult:
+        """Shared close path once the Position and its key are in hand"""
+        if quantity <= _EPS or quantity > pos.quantity + _EPS:
+            return self._close_result.set(0.0, 0.0, 0.0, _ERR_BAD_QTY)
+
+        # Branchless slippage: closing is the mirror of opening, so the
+        # sign flips (-1 long, +1 short)
+        exec_price = _slippage_nb(price, self.slippage_rate, -pos.side_sign)
+
         # Calculate close value and fee
         close_value = quantity * exec_price
         fee_rate = self.maker_fee_rate if is_maker else self.taker_fee_rate
@@ -212,9 +634,8 @@ class BacktestAccount:
         # Calculate PnL for the quantity being closed
         pnl = self._realized_pnl(pos, quantity, exec_price)
         
-        # Calculate margin to return
-        close_ratio = quantity / pos.quantity
-        margin_returned = pos.margin * close_ratio
+        # Margin to return: cached per-unit margin, no ratio division
+        margin_returned = pos.margin_per_unit * quantity
         
         # Update cash (return margin + pnl - fee)
         self.cash += margin_returned + pnl - fee
@@ -223,47 +644,81 @@ class BacktestAccount:
         # Update position
         pos.quantity -= quantity
         pos.margin -= margin_returned
-        pos.notional -= (quantity * pos.entry_price)
-        
-        # Remove position if fully closed
-        if pos.quantity < self.EPSILON:
-            self._remove_position(pos)
-        
-        return pnl, fee, exec_price, None
+
+        # Remove position if fully closed — key already in hand, so no
+        # re-derivation inside the removal path
+        if pos.quantity < _EPS:
+            self._remove_position_by_key(key)
+        else:
+            self._sync_row(pos)
+
+        self._log_fill(timestamp, key >> 1, pos.side_sign,
+                       quantity, exec_price, fee, pnl)
+        return self._close_result.set(pnl, fee, exec_price, None)
     
-    def total_equity(self, price_map: Dict[str, float]) -> Tuple[float, float, Dict[str, float]]:
+    def build_price_vec(self, price_map: Dict[str, float]) -> np.ndarray:
+        """
+        Convert a {symbol: price} dict to a dense vector indexed by the
+        account's interned symbol ids (0.0 where no price is known).
+        Drivers that mark to market every tick can fill this buffer once
+        per tick and pass it to total_equity, skipping all dict lookups.
+        """
+        vec = np.zeros(len(self._id_sym))
+        for symbol, price in price_map.items():
+            sid = self._sym_ids.get(symbol.upper())
+            if sid is not None:
+                vec[sid] = price
+        return vec
+
+    def total_equity(self, price_map) -> Tuple[float, float, Dict[str, float]]:
         """
         Calculate total account equity.
-        
+
         Args:
-            price_map: Current prices {symbol: price}
-            
+            price_map: Current prices {symbol: price}, or a dense price
+                       vector from build_price_vec (fast path: one fancy-
+                       indexed gather instead of per-position dict gets)
+
         Returns:
             (total_equity, unrealized_pnl, per_position_pnl)
         """
-        unrealized = 0.0
-        margin = 0.0
-        per_symbol = {}
-        
-        for key, pos in self.positions.items():
-            current_price = price_map.get(pos.symbol, pos.entry_price)
-            pnl = self._unrealized_pnl(pos, current_price)
-            
-            unrealized += pnl
-            margin += pos.margin
-            per_symbol[key] = pnl
-        
+        n = self._n_active
+        if n == 0:
+            return self.cash, 0.0, {}
+
+        entry = self._entry[:n]
+        if isinstance(price_map, np.ndarray):
+            gathered = price_map[self._row_sym_idx[:n]]
+            # 0.0 marks "no price known" -> fall back to entry
+            current = np.where(gathered > 0.0, gathered, entry)
+        else:
+            # Dict path: the only Python-level work is the price gather
+            # (missing price -> entry)
+            current = np.fromiter(
+                (price_map.get(self._row_symbols[i], entry[i]) for i in range(n)),
+                dtype=np.float64, count=n
+            )
+        pnl_vec = (current - entry) * self._sign[:n] * self._qty[:n]
+
+        unrealized = float(pnl_vec.sum())
+        margin = float(self._margin_arr[:n].sum())
+        per_symbol = dict(zip(self._row_keys, pnl_vec.tolist()))
+
         total_equity = self.cash + margin + unrealized
         return total_equity, unrealized, per_symbol
     
     def get_positions(self) -> List[Position]:
         """Get all open positions"""
         return list(self.positions.values())
+
+    def get_position(self, symbol: str, side: str) -> Optional[Position]:
+        """Look up a single position by symbol/side (None when absent)"""
+        return self.positions.get(self._position_key(symbol.upper(), side))
     
     def position_leverage(self, symbol: str, side: str) -> int:
         """Get leverage of a position"""
-        key = self._position_key(symbol, side)
-        if key in self.positions and self.positions[key].quantity > self.EPSILON:
+        key = self._position_key(symbol.upper(), side)
+        if key in self.positions and self.positions[key].quantity > _EPS:
             return self.positions[key].leverage
         return 0
     
@@ -284,43 +739,54 @@ class BacktestAccount:
         self.cash = cash
         self.realized_pnl = realized
         self.positions.clear()
-        
-        for snap in snapshots:
-            pos = Position(
-                symbol=snap['symbol'],
-                side=snap['side'],
-                quantity=snap['position_amt'],
-                entry_price=snap['entry_price'],
-                leverage=snap.get('leverage', 1),
-                margin=snap['position_amt'] * snap['entry_price'] / snap.get('leverage', 1),
-                notional=snap['position_amt'] * snap['entry_price'],
-                liquidation_price=snap.get('liquidation_price', 0.0),
-                open_time=0
-            )
-            key = self._position_key(pos.symbol, pos.side)
-            self.positions[key] = pos
+        self._row_keys.clear()
+        self._row_symbols.clear()
+        self._n_active = 0
+        if not snapshots:
+            return
+
+        # Column-extract once, then do all the per-row arithmetic as
+        # array expressions; the remaining Python loop only builds the
+        # Position objects and keys
+        n = len(snapshots)
+        qty = np.fromiter((s['position_amt'] for s in snapshots), np.float64, count=n)
+        entry = np.fromiter((s['entry_price'] for s in snapshots), np.float64, count=n)
+        lev = np.fromiter((s.get('leverage', 1) for s in snapshots), np.int32, count=n)
+        notional = qty * entry
+        margin = notional / lev
+        inv_lev = 1.0 / lev
+        margin_per_unit = np.where(qty > _EPS, margin / np.maximum(qty, _EPS), 0.0)
+
+        while self._capacity < n:
+            self._grow_soa()
+
+        for i, snap in enumerate(snapshots):
+            pos = self._ensure_position(snap['symbol'].upper(), snap['side'])
+            pos.quantity = float(qty[i])
+            pos.entry_price = float(entry[i])
+            pos.leverage = int(lev[i])
+            pos.inv_leverage = float(inv_lev[i])
+            pos.margin = float(margin[i])
+            pos.margin_per_unit = float(margin_per_unit[i])
+            pos.liquidation_price = snap.get('liquidation_price', 0.0)
+
+        # Bulk-fill the SoA columns in three contiguous writes instead of
+        # one _sync_row per position
+        self._entry[:n] = entry
+        self._qty[:n] = qty
+        self._margin_arr[:n] = margin
     
     @staticmethod
     def _apply_slippage(price: float, rate: float, side: str, is_open: bool) -> float:
         """
         Apply slippage to execution price.
-        
-        For longs: buying pushes price up, selling pushes down
-        For shorts: selling pushes price down, buying pushes up
+
+        Long-open and short-close execute above market; long-close and
+        short-open below. That truth table collapses to a single sign:
+        +1 when (side == 'long') == is_open, else -1.
         """
-        slippage_amount = price * rate
-        
-        if side == 'long':
-            if is_open:
-                return price + slippage_amount  # Buy at higher price
-            else:
-                return price - slippage_amount  # Sell at lower price
-        else:  # short
-            if is_open:
-                return price - slippage_amount  # Short at lower price
-            else:
-                return price + slippage_amount  # Cover at higher price
-    
+        return _slippage_nb(price, rate, 1 if (side == 'long') == is_open else -1)
+
     @staticmethod
     def _compute_liquidation(entry: float, leverage: int, side: str, mm_rate: float) -> float:
         """
@@ -328,32 +794,17 @@ class BacktestAccount:
         For long: liq when price <= entry * (1 - 1/leverage) / (1 - mm_rate)
         For short: symmetric.
         """
-        if leverage <= 0:
-            return 0.0
-        if mm_rate < 0:
-            mm_rate = 0.0
+        return _liquidation_nb(entry, leverage, 1 if side == 'long' else -1, mm_rate)
 
-        base_move = 1.0 / leverage
-        if side == 'long':
-            return entry * (1.0 - base_move) / max(1e-6, (1.0 - mm_rate))
-        else:
-            return entry * (1.0 + base_move) / max(1e-6, (1.0 - mm_rate))
-    
     @staticmethod
     def _realized_pnl(pos: Position, qty: float, exit_price: float) -> float:
         """Calculate realized PnL for closing a position"""
-        if pos.side == 'long':
-            return (exit_price - pos.entry_price) * qty
-        else:  # short
-            return (pos.entry_price - exit_price) * qty
-    
+        return _pnl_nb(pos.entry_price, exit_price, qty, pos.side_sign)
+
     @staticmethod
     def _unrealized_pnl(pos: Position, current_price: float) -> float:
         """Calculate unrealized PnL for an open position"""
-        if pos.side == 'long':
-            return (current_price - pos.entry_price) * pos.quantity
-        else:  # short
-            return (pos.entry_price - current_price) * pos.quantity
+        return _pnl_nb(pos.entry_price, current_price, pos.quantity, pos.side_sign)
 
     def apply_funding(self, funding_rates: Dict[str, float]) -> float:
         """
@@ -366,17 +817,21 @@ class BacktestAccount:
         Returns:
             total_funding (positive means received, negative means paid)
         """
-        total = 0.0
-        for pos in list(self.positions.values()):
-            rate = funding_rates.get(pos.symbol)
-            if rate is None:
-                continue
-            funding = pos.notional * rate
-            # longs pay when rate > 0, shorts receive; reverse if rate < 0
-            if pos.side == 'long':
-                total -= funding
-            else:
-                total += funding
+        n = self._n_active
+        if n == 0:
+            return 0.0
+
+        # One pass over the compact SoA rows (rows 0..n are always the
+        # live positions thanks to swap-with-tail removal), instead of
+        # pointer-chasing the positions dict. notional == qty * entry by
+        # construction, and longs pay when rate > 0 (sign flips it).
+        rates = np.fromiter(
+            (funding_rates.get(self._row_symbols[i], 0.0) for i in range(n)),
+            dtype=np.float64, count=n
+        )
+        funding = self._qty[:n] * self._entry[:n] * rates * -self._sign[:n]
+        total = float(funding.sum())
+
         # Apply to cash/realized
         self.cash += total
         self.realized_pnl += total
@@ -2,16 +2,54 @@
 Backtest runner for trading agent.
 Orchestrates historical data replay and performance analysis.
 """
+import asyncio
 import json
+import os
 import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 
 from .backtest_account import BacktestAccount, Position
+from ._decision_cache import DecisionCache
+from .indicators import njit
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@njit(cache=True)
+def _trade_stats_nb(pnl, sym_id, n_syms):
+    """
+    One pass over the closing-trade arrays: win/loss totals and counts
+    plus per-symbol PnL and trade counts. Compiled by numba when
+    available; plain Python otherwise (same shim as the indicators).
+    """
+    total_win = 0.0
+    total_loss = 0.0
+    win_count = 0
+    loss_count = 0
+    per_symbol = np.zeros(n_syms)
+    per_symbol_count = np.zeros(n_syms, dtype=np.int64)
+    for i in range(pnl.shape[0]):
+        p = pnl[i]
+        if p > 0:
+            total_win += p
+            win_count += 1
+        elif p < 0:
+            total_loss -= p
+            loss_count += 1
+        per_symbol[sym_id[i]] += p
+        per_symbol_count[sym_id[i]] += 1
+    return total_win, total_loss, win_count, loss_count, per_symbol, per_symbol_count
+
+
+@dataclass(slots=True)
 class TradeEvent:
     """Record of a simulated trade"""
     timestamp: int
@@ -31,7 +69,63 @@ class TradeEvent:
     note: str = ""
 
 
-@dataclass
+# Streamed trades are written as positional JSON arrays against this
+# field order (declared once in the file's header line) instead of
+# repeating every key in a json.dumps(asdict(...)) dict per trade;
+# orjson takes over the encoding when installed
+_TRADE_FIELDS = tuple(f.name for f in fields(TradeEvent))
+
+if ORJSON_AVAILABLE:
+    def _dump_line(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    def _dump_line(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+
+class PriceView:
+    """
+    Read-only dict-like view over one row of the precomputed close
+    matrix. The runner reuses a single instance and repoints it at the
+    current cycle's row, so downstream code keeps its price_map[...] /
+    .get(...) access patterns without a fresh dict being built and
+    hashed every cycle. NaN marks "no candle yet" and reads as missing.
+    """
+    __slots__ = ('_idx', '_row')
+
+    def __init__(self, symbol_idx: Dict[str, int]):
+        self._idx = symbol_idx
+        self._row = None
+
+    def set_row(self, row: np.ndarray) -> 'PriceView':
+        self._row = row
+        return self
+
+    def __getitem__(self, symbol: str) -> float:
+        value = self._row[self._idx[symbol]]
+        if np.isnan(value):
+            raise KeyError(symbol)
+        return float(value)
+
+    def get(self, symbol: str, default=None):
+        j = self._idx.get(symbol)
+        if j is None:
+            return default
+        value = self._row[j]
+        return default if np.isnan(value) else float(value)
+
+    def __contains__(self, symbol: str) -> bool:
+        j = self._idx.get(symbol)
+        return j is not None and not np.isnan(self._row[j])
+
+    def items(self):
+        for symbol, j in self._idx.items():
+            value = self._row[j]
+            if not np.isnan(value):
+                yield symbol, float(value)
+
+
+@dataclass(slots=True)
 class EquityPoint:
     """Equity snapshot at a point in time"""
     timestamp: int
@@ -43,6 +137,21 @@ class EquityPoint:
     cycle: int
 
 
+# Struct-of-arrays layout for the equity curve: one row per cycle in a
+# single structured array instead of one EquityPoint (and its boxed
+# floats) per cycle. Sharpe/drawdown read columns directly; the
+# equity_history property materializes dataclasses only when asked.
+EQ_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('equity', 'f8'),
+    ('available', 'f8'),
+    ('pnl', 'f8'),
+    ('pnl_pct', 'f8'),
+    ('drawdown_pct', 'f8'),
+    ('cycle', 'i4'),
+])
+
+
 @dataclass
 class BacktestMetrics:
     """Final backtest performance metrics"""
@@ -59,6 +168,17 @@ class BacktestMetrics:
     liquidated: bool
 
 
+def _run_symbol_split(runner_kwargs: Dict) -> Tuple['BacktestMetrics', List[EquityPoint], List[TradeEvent]]:
+    """
+    Worker for run_parallel: build one runner in the child process and
+    run it. Module-level (not a method/lambda) so ProcessPoolExecutor
+    can pickle the call; the agent inside runner_kwargs must itself be
+    picklable.
+    """
+    runner = BacktestRunner(**runner_kwargs)
+    return runner.run(verbose=False)
+
+
 class BacktestRunner:
     """
     Runs backtest simulation with historical data.
@@ -75,11 +195,14 @@ class BacktestRunner:
         fee_bps: float = 5.0,
         slippage_bps: float = 2.0,
         decision_interval: str = "1h",  # How often to make decisions
-        leverage_config: Optional[Dict[str, int]] = None
+        leverage_config: Optional[Dict[str, int]] = None,
+        enable_decision_cache: bool = True,
+        trade_log_path: Optional[str] = None,
+        keep_trades_in_memory: bool = True
     ):
         """
         Initialize backtest runner.
-        
+
         Args:
             agent: Your RealWorldTradingAgent instance
             symbols: List of trading pairs
@@ -90,6 +213,13 @@ class BacktestRunner:
             slippage_bps: Slippage in basis points
             decision_interval: How often AI makes decisions ('1h', '4h', etc.)
             leverage_config: {'BTC': 5, 'ETH': 5, 'default': 3}
+            enable_decision_cache: Replay identical AI decisions from
+                .cache/decisions/ instead of re-querying the model
+            trade_log_path: Stream trades to this newline-JSON file
+                during the run (bounded memory for very long backtests)
+            keep_trades_in_memory: Keep TradeEvent objects in
+                trade_events; disable for tick-level runs where the
+                JSONL stream plus the metrics columns are enough
         """
         self.agent = agent
         self.symbols = symbols
@@ -106,17 +236,70 @@ class BacktestRunner:
             'ETH': 5,
             'default': 3
         }
+
+        # Symbols are a small fixed set, so resolve the BTC/ETH/default
+        # substring rules once here; per-trade lookups are then O(1)
+        self._lev_cache = {
+            s: (self.leverage_config.get('BTC', 5) if 'BTC' in s
+                else self.leverage_config.get('ETH', 5) if 'ETH' in s
+                else self.leverage_config.get('default', 3))
+            for s in symbols
+        }
         
         # State tracking
         self.cycle_count = 0
-        self.equity_history: List[EquityPoint] = []
         self.trade_events: List[TradeEvent] = []
         self.max_equity = initial_balance
         self.min_equity = initial_balance
         self.max_drawdown = 0.0
-        
-        # Historical data cache
+
+        # Equity curve as a structured array (sized in run() once the
+        # cycle count is known); EquityPoint dataclasses are built
+        # lazily via the equity_history property
+        self.equity_arr = np.empty(0, dtype=EQ_DTYPE)
+        self._eq_n = 0
+        self._eq_history_cache: Optional[List[EquityPoint]] = None
+
+        # Parallel columns of closing trades (realized pnl + symbol
+        # index) feeding the njit trade-stats kernel
+        self._close_pnl: List[float] = []
+        self._close_sym_id: List[int] = []
+
+        # Content-addressed cache of AI decisions: warm re-runs over the
+        # same data skip the model entirely
+        self._decision_cache = DecisionCache() if enable_decision_cache else None
+        self._agent_cache_name = getattr(agent, 'name', 'agent') or 'agent'
+
+        # Agents with an async decision API (coroutine _get_ai_decision)
+        # are awaited instead of called; detected once, not per cycle
+        self._agent_decide_async = asyncio.iscoroutinefunction(
+            getattr(agent, '_get_ai_decision', None)
+        )
+
+        # Optional trade streaming: append each trade as one JSON line
+        # while running instead of (or besides) growing trade_events
+        self.trade_log_path = trade_log_path
+        self._keep_trades = keep_trades_in_memory
+        self._trade_fp = None
+        
+        # Historical data cache; _hist_arrays holds per-symbol parallel
+        # numpy columns (sorted timestamps + OHLCV) so per-cycle lookups
+        # are binary searches, not list scans
         self.historical_data: Dict[str, List[Dict]] = {}
+        self._hist_arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Per-cycle close prices, precomputed as one matrix after data
+        # load; run() hands out row views instead of building a dict of
+        # prices every cycle
+        self._symbol_idx: Dict[str, int] = {s: i for i, s in enumerate(symbols)}
+        self._close_matrix: Optional[np.ndarray] = None
+        self._price_view = PriceView(self._symbol_idx)
+
+        # Reusable market snapshot: the outer dict and one inner dict
+        # per symbol live for the whole run and are overwritten in
+        # place each cycle (consumers read them within the cycle, never
+        # retain them), so a snapshot allocates nothing
+        self._md_snapshot: Dict[str, Dict] = {}
     
     def run(self, verbose: bool = True) -> Tuple[BacktestMetrics, List[EquityPoint], List[TradeEvent]]:
         """
@@ -130,7 +313,7 @@ class BacktestRunner:
             print(f"Symbols: {', '.join(self.symbols)}")
             print(f"Period: {datetime.fromtimestamp(self.start_time)} to {datetime.fromtimestamp(self.end_time)}")
             print(f"Initial Balance: ${self.account.initial_balance:.2f}")
-            print(f"Fee: {self.account.fee_rate * 10000:.2f} bps")
+            print(f"Fee: {self.account.taker_fee_rate * 10000:.2f} bps")
             print(f"Slippage: {self.account.slippage_rate * 10000:.2f} bps")
             print("=" * 60)
         
@@ -139,15 +322,33 @@ class BacktestRunner:
         
         # Get decision timestamps based on interval
         decision_timestamps = self._get_decision_timestamps()
-        
+
         total_cycles = len(decision_timestamps)
-        
-        for idx, ts in enumerate(decision_timestamps):
+
+        # One vectorized searchsorted per symbol up front; each cycle
+        # then indexes a row instead of rebuilding a price dict
+        self._close_matrix = self._build_close_matrix(decision_timestamps)
+
+        # The cycle count is known exactly, so pre-size the equity curve
+        # in one allocation
+        self.equity_arr = np.empty(total_cycles, dtype=EQ_DTYPE)
+        self._eq_n = 0
+        self._eq_history_cache = None
+
+        # Large buffer so streamed trades land in few big writes; the
+        # header line declares the field order once, every trade after
+        # it is a positional array
+        if self.trade_log_path:
+            self._trade_fp = open(self.trade_log_path, 'w', buffering=1 << 20)
+            self._trade_fp.write(_dump_line({'fields': list(_TRADE_FIELDS)}) + '\n')
+
+        for idx in range(total_cycles):
+            ts = int(decision_timestamps[idx])
             self.cycle_count += 1
-            
+
             # Get current market data at this timestamp
             market_data = self._get_market_data_at(ts)
-            price_map = {sym: data['close'] for sym, data in market_data.items()}
+            price_map = self._price_view.set_row(self._close_matrix[idx])
             
             # Check for liquidations
             liquidation_note = self._check_liquidations(price_map)
@@ -157,28 +358,49 @@ class BacktestRunner:
                 self._record_equity_point(ts, price_map, liquidated=True)
                 break
             
+            # Mark to market once per cycle; the progress print, the AI
+            # context and (trade-free cycles) the equity record all
+            # reuse this tuple instead of recomputing unrealized PnL
+            equity_snapshot = self.account.total_equity(price_map)
+
             # Get AI decision
             if verbose and self.cycle_count % 10 == 0:
-                equity, _, _ = self.account.total_equity(price_map)
                 progress = (idx + 1) / total_cycles * 100
-                print(f"Cycle {self.cycle_count}/{total_cycles} ({progress:.1f}%) | Equity: ${equity:.2f}")
-            
+                print(f"Cycle {self.cycle_count}/{total_cycles} ({progress:.1f}%) | Equity: ${equity_snapshot[0]:.2f}")
+
+            trades = []
             try:
-                decision = self._get_ai_decision(ts, market_data, price_map)
-                
+                decision = self._get_ai_decision(ts, market_data, price_map, equity_snapshot)
+
                 # Execute decision
                 trades = self._execute_decision(decision, price_map, ts)
-                self.trade_events.extend(trades)
-                
+                if self._trade_fp is not None:
+                    for trade in trades:
+                        self._trade_fp.write(_dump_line(
+                            [getattr(trade, name) for name in _TRADE_FIELDS]
+                        ) + '\n')
+                if self._keep_trades:
+                    self.trade_events.extend(trades)
+
             except Exception as e:
                 if verbose:
                     print(f"[WARNING] Error in cycle {self.cycle_count}: {e}")
                 # Continue even if AI decision fails
                 decision = {'action': 'hold'}
             
-            # Record equity point
-            self._record_equity_point(ts, price_map)
-        
+            # Record equity point; only re-mark if this cycle actually
+            # changed the account
+            if trades:
+                equity_snapshot = self.account.total_equity(price_map)
+            self._record_equity_point(ts, price_map, equity_snapshot=equity_snapshot)
+
+        if self._trade_fp is not None:
+            self._trade_fp.close()
+            self._trade_fp = None
+
+        # Running peaks and drawdowns in one vectorized pass
+        self._finalize_drawdown()
+
         # Calculate final metrics
         metrics = self._calculate_metrics()
         
@@ -195,29 +417,233 @@ class BacktestRunner:
                 print("[WARNING] Account was LIQUIDATED")
         
         return metrics, self.equity_history, self.trade_events
-    
+
+    def run_parallel(
+        self,
+        symbol_splits: List[List[str]],
+        verbose: bool = True
+    ) -> Tuple[BacktestMetrics, List[EquityPoint], List[TradeEvent]]:
+        """
+        Run one independent backtest per symbol split across processes
+        and merge the results.
+
+        Each split gets its own account seeded with initial_balance /
+        len(symbol_splits), so splits never compete for the same cash.
+        That is the caveat: a single-account run is path-dependent
+        (a BTC loss shrinks what the ETH leg can size next cycle), so
+        the merged numbers match a sequential run only when cash is not
+        the binding constraint. Use it for coarse sweeps, confirm with
+        run().
+
+        The agent must be picklable — it is shipped to each worker
+        process along with the runner config.
+
+        Returns the same (metrics, equity_history, trade_events) shape
+        as run(): trade events merged chronologically, equity curves
+        summed per cycle across splits, metrics re-aggregated from the
+        merged curve and trade totals.
+        """
+        n_splits = len(symbol_splits)
+        if n_splits == 0:
+            raise ValueError("symbol_splits must not be empty")
+
+        base_kwargs = {
+            'agent': self.agent,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'initial_balance': self.account.initial_balance / n_splits,
+            'fee_bps': self.account.taker_fee_rate * 10000,
+            'slippage_bps': self.account.slippage_rate * 10000,
+            'decision_interval': self.decision_interval,
+            'leverage_config': self.leverage_config,
+            'enable_decision_cache': self._decision_cache is not None,
+        }
+
+        if verbose:
+            print(f"\n[START] Parallel backtest: {n_splits} splits, "
+                  f"{os.cpu_count()} CPUs")
+
+        with ProcessPoolExecutor(max_workers=min(n_splits, os.cpu_count() or 1)) as pool:
+            futures = [
+                pool.submit(_run_symbol_split, {**base_kwargs, 'symbols': split})
+                for split in symbol_splits
+            ]
+            results = [f.result() for f in futures]
+
+        return self._merge_split_results(results, verbose=verbose)
+
+    def _merge_split_results(
+        self,
+        results: List[Tuple[BacktestMetrics, List[EquityPoint], List[TradeEvent]]],
+        verbose: bool = True
+    ) -> Tuple[BacktestMetrics, List[EquityPoint], List[TradeEvent]]:
+        """Re-aggregate per-split outputs into one run-shaped result"""
+        initial = self.account.initial_balance
+
+        # Trades: one chronological stream across all splits
+        trade_events = sorted(
+            (t for _, _, trades in results for t in trades),
+            key=lambda t: (t.timestamp, t.cycle)
+        )
+
+        # Equity: the splits share the deterministic decision grid, so
+        # summing per cycle gives the combined account. A liquidated
+        # split stops recording early; carry its last equity forward.
+        curves = [history for _, history, _ in results]
+        n_cycles = max((len(c) for c in curves), default=0)
+        equity_history: List[EquityPoint] = []
+        for i in range(n_cycles):
+            points = [c[min(i, len(c) - 1)] for c in curves if c]
+            template = max(points, key=lambda p: p.cycle)
+            equity = sum(p.equity for p in points)
+            available = sum(p.available for p in points)
+            pnl = equity - initial
+            equity_history.append(EquityPoint(
+                timestamp=template.timestamp,
+                equity=equity,
+                available=available,
+                pnl=pnl,
+                pnl_pct=pnl / initial * 100,
+                drawdown_pct=0.0,
+                cycle=template.cycle,
+            ))
+
+        # Drawdown/Sharpe recomputed on the combined curve (per-split
+        # drawdowns don't compose — offsetting legs cancel)
+        eq = np.array([p.equity for p in equity_history])
+        if eq.shape[0]:
+            peaks = np.maximum(np.maximum.accumulate(eq), initial)
+            safe_peaks = np.where(peaks > 0, peaks, 1.0)
+            dd_pct = np.where(peaks > 0, (peaks - eq) / safe_peaks * 100, 0.0)
+            for point, dd in zip(equity_history, dd_pct):
+                point.drawdown_pct = float(dd)
+            max_drawdown = float(dd_pct.max())
+        else:
+            max_drawdown = 0.0
+
+        sharpe = 0.0
+        if eq.shape[0] >= 2:
+            prev = eq[:-1]
+            mask = prev > 0
+            returns = (eq[1:][mask] - prev[mask]) / prev[mask]
+            if returns.shape[0] >= 2 and returns.std(ddof=1) > 0:
+                sharpe = float(returns.mean() / returns.std(ddof=1) * np.sqrt(365))
+
+        # Trade totals reconstructed from each split's counts/averages
+        total_trades = sum(m.trades for m, _, _ in results)
+        win_count = sum(round(m.win_rate / 100 * m.trades) for m, _, _ in results)
+        total_win = sum(m.avg_win * round(m.win_rate / 100 * m.trades) for m, _, _ in results)
+        loss_count = sum(
+            m.trades - round(m.win_rate / 100 * m.trades) for m, _, _ in results
+        )
+        total_loss = sum(
+            m.avg_loss * (m.trades - round(m.win_rate / 100 * m.trades))
+            for m, _, _ in results
+        )
+
+        final_equity = float(eq[-1]) if eq.shape[0] else initial
+        best = max(results, key=lambda r: r[0].total_return_pct)[0]
+        worst = min(results, key=lambda r: r[0].total_return_pct)[0]
+
+        metrics = BacktestMetrics(
+            total_return_pct=(final_equity - initial) / initial * 100,
+            max_drawdown_pct=max_drawdown,
+            sharpe_ratio=sharpe,
+            profit_factor=(total_win / total_loss) if total_loss > 0
+                          else (999 if total_win > 0 else 0),
+            win_rate=(win_count / total_trades * 100) if total_trades else 0.0,
+            trades=total_trades,
+            avg_win=(total_win / win_count) if win_count else 0.0,
+            avg_loss=(total_loss / loss_count) if loss_count else 0.0,
+            best_symbol=best.best_symbol,
+            worst_symbol=worst.worst_symbol,
+            liquidated=any(m.liquidated for m, _, _ in results),
+        )
+
+        if verbose:
+            print(f"[MERGE] {len(results)} splits -> {total_trades} trades, "
+                  f"return {metrics.total_return_pct:+.2f}%")
+
+        return metrics, equity_history, trade_events
+
     def _load_historical_data(self):
         """Load historical kline data for all symbols"""
         print(f"\n[LOAD] Loading historical data...")
-        
-        for symbol in self.symbols:
+
+        # Agents wrapping an exchange with multi-symbol support can
+        # expose get_klines_batch and collapse N round trips into one;
+        # anything missing from the batch (or a batch failure) falls
+        # through to the per-symbol path below
+        batch_fetch = getattr(self.agent, 'get_klines_batch', None)
+        if batch_fetch is not None:
             try:
-                # Use agent's get_klines method to fetch historical data
-                klines = self.agent.get_klines(
-                    symbol,
-                    interval=self.decision_interval,
-                    limit=1000  # Adjust based on time range
+                batch = batch_fetch(
+                    self.symbols, interval=self.decision_interval, limit=1000
                 )
-                
+            except Exception as e:
+                print(f"   [WARN] Batch fetch failed ({e}); falling back to per-symbol")
+            else:
+                for symbol in self.symbols:
+                    klines = batch.get(symbol) or []
+                    self.historical_data[symbol] = klines
+                    if klines:
+                        self._hist_arrays[symbol] = self._build_hist_arrays(klines)
+                        print(f"   [OK] {symbol}: {len(klines)} candles")
+                    else:
+                        print(f"   [FAIL] {symbol}: no data in batch response")
+                return
+
+        def fetch(symbol):
+            # Use agent's get_klines method to fetch historical data
+            return self.agent.get_klines(
+                symbol,
+                interval=self.decision_interval,
+                limit=1000  # Adjust based on time range
+            )
+
+        # The per-symbol fetches are independent network calls, so fire
+        # them concurrently; failures stay per-symbol as before
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(self.symbols)))) as pool:
+            futures = {symbol: pool.submit(fetch, symbol) for symbol in self.symbols}
+
+        for symbol in self.symbols:
+            try:
+                klines = futures[symbol].result()
+
                 self.historical_data[symbol] = klines
+                self._hist_arrays[symbol] = self._build_hist_arrays(klines)
                 print(f"   [OK] {symbol}: {len(klines)} candles")
-                
+
             except Exception as e:
                 print(f"   [FAIL] {symbol}: Failed to load data - {e}")
                 self.historical_data[symbol] = []
+
+    @staticmethod
+    def _build_hist_arrays(klines: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert a symbol's kline list to (timestamps, ohlcv) numpy arrays.
+
+        Timestamps are normalized to seconds once at load time; ohlcv is
+        a (5, n) float64 matrix (open/high/low/close/volume rows) so a
+        snapshot is two array indexes instead of a list walk.
+        """
+        n = len(klines)
+        ts = np.empty(n, dtype=np.int64)
+        ohlcv = np.empty((5, n))
+        for i, kline in enumerate(klines):
+            kline_time = kline.get('timestamp', kline.get('open_time', 0))
+            if kline_time > 1e10:
+                kline_time = kline_time // 1000
+            ts[i] = kline_time
+            ohlcv[0, i] = float(kline.get('open', 0))
+            ohlcv[1, i] = float(kline.get('high', 0))
+            ohlcv[2, i] = float(kline.get('low', 0))
+            ohlcv[3, i] = float(kline.get('close', 0))
+            ohlcv[4, i] = float(kline.get('volume', 0))
+        return ts, ohlcv
     
-    def _get_decision_timestamps(self) -> List[int]:
-        """Generate list of timestamps where AI makes decisions"""
+    def _get_decision_timestamps(self) -> np.ndarray:
+        """Generate the timestamps where AI makes decisions"""
         # Parse interval (e.g., "1h" -> 3600 seconds)
         interval_map = {
             '1m': 60,
@@ -227,41 +653,60 @@ class BacktestRunner:
             '4h': 14400,
             '1d': 86400
         }
-        
+
         interval_seconds = interval_map.get(self.decision_interval, 3600)
-        
-        timestamps = []
-        current = self.start_time
-        
-        while current <= self.end_time:
-            timestamps.append(current)
-            current += interval_seconds
-        
-        return timestamps
+
+        # One allocation, no per-element boxing; also what the
+        # vectorized searchsorted in _build_close_matrix wants
+        return np.arange(self.start_time, self.end_time + 1, interval_seconds,
+                         dtype=np.int64)
     
+    def _build_close_matrix(self, decision_timestamps) -> np.ndarray:
+        """
+        Precompute close prices for every (cycle, symbol) pair with one
+        vectorized searchsorted per symbol. NaN marks cycles before a
+        symbol's first candle.
+        """
+        matrix = np.full((len(decision_timestamps), len(self.symbols)), np.nan)
+        ts_query = np.asarray(decision_timestamps, dtype=np.int64)
+        for symbol, j in self._symbol_idx.items():
+            arrays = self._hist_arrays.get(symbol)
+            if arrays is None or arrays[0].shape[0] == 0:
+                continue
+            ts_arr, ohlcv = arrays
+            idx = np.searchsorted(ts_arr, ts_query, side='right') - 1
+            valid = idx >= 0
+            matrix[valid, j] = ohlcv[3, idx[valid]]
+        return matrix
+
     def _get_market_data_at(self, timestamp: int) -> Dict[str, Dict]:
-        """Get market data snapshot at a specific timestamp"""
-        market_data = {}
-        
-        for symbol, klines in self.historical_data.items():
-            # Find the kline that contains this timestamp
-            for kline in klines:
-                kline_time = kline.get('timestamp', kline.get('open_time', 0))
-                
-                # Convert to seconds if in milliseconds
-                if kline_time > 1e10:
-                    kline_time = kline_time // 1000
-                
-                if kline_time <= timestamp:
-                    market_data[symbol] = {
-                        'timestamp': kline_time,
-                        'open': float(kline.get('open', 0)),
-                        'high': float(kline.get('high', 0)),
-                        'low': float(kline.get('low', 0)),
-                        'close': float(kline.get('close', 0)),
-                        'volume': float(kline.get('volume', 0))
-                    }
-        
+        """
+        Get market data snapshot at a specific timestamp.
+
+        Returns the shared per-run snapshot dicts refreshed in place —
+        valid until the next call, so copy if a snapshot must outlive
+        its cycle.
+        """
+        market_data = self._md_snapshot
+
+        for symbol, (ts_arr, ohlcv) in self._hist_arrays.items():
+            # Klines are chronologically sorted, so the candle in effect
+            # at `timestamp` is a binary search away — O(log n) instead
+            # of re-walking the whole list every cycle
+            idx = int(np.searchsorted(ts_arr, timestamp, side='right')) - 1
+            if idx < 0:
+                market_data.pop(symbol, None)
+                continue
+            entry = market_data.get(symbol)
+            if entry is None:
+                entry = market_data[symbol] = {}
+            entry['timestamp'] = int(ts_arr[idx])
+            entry['open'] = ohlcv[0, idx]
+            entry['high'] = ohlcv[1, idx]
+            entry['low'] = ohlcv[2, idx]
+            entry['close'] = ohlcv[3, idx]
+            entry['volume'] = ohlcv[4, idx]
+
         return market_data
     
     def _check_liquidations(self, price_map: Dict[str, float]) -> Optional[str]:
@@ -276,10 +721,14 @@ class BacktestRunner:
         
         return None
     
-    def _get_ai_decision(self, timestamp: int, market_data: Dict, price_map: Dict) -> Dict:
+    def _get_ai_decision(self, timestamp: int, market_data: Dict, price_map: Dict,
+                         equity_snapshot: Optional[Tuple] = None) -> Dict:
         """Get AI trading decision (simplified - uses agent's decision logic)"""
-        # Build context similar to live trading
-        equity, unrealized, _ = self.account.total_equity(price_map)
+        # Build context similar to live trading; run() passes its
+        # per-cycle mark-to-market so we don't redo it here
+        if equity_snapshot is None:
+            equity_snapshot = self.account.total_equity(price_map)
+        equity, unrealized, _ = equity_snapshot
         
         # Convert positions to agent format
         positions = []
@@ -304,16 +753,40 @@ class BacktestRunner:
             'unrealized_pnl': unrealized
         }
         
-        # Call agent's AI decision method
+        instruction = "Backtest mode: simulate historical trading"
+
+        # Check the decision cache before paying for the model call
+        cache_key = None
+        if self._decision_cache is not None:
+            cache_key = DecisionCache.make_key(timestamp, market_data, instruction)
+            cached = self._decision_cache.get(self._agent_cache_name, cache_key)
+            if cached is not None:
+                return cached
+
+        # Call agent's AI decision method (awaited when the agent
+        # exposes a coroutine — network latency then overlaps with any
+        # concurrent work the agent schedules internally)
         # Note: This is simplified - you may need to adapt based on your agent's interface
-        decision = self.agent._get_ai_decision(
-            cycle_number=self.cycle_count,
-            balance=balance_info,
-            positions=positions,
-            market_data=market_data,
-            custom_instruction="Backtest mode: simulate historical trading"
-        )
-        
+        if self._agent_decide_async:
+            decision = asyncio.run(self.agent._get_ai_decision(
+                cycle_number=self.cycle_count,
+                balance=balance_info,
+                positions=positions,
+                market_data=market_data,
+                custom_instruction=instruction
+            ))
+        else:
+            decision = self.agent._get_ai_decision(
+                cycle_number=self.cycle_count,
+                balance=balance_info,
+                positions=positions,
+                market_data=market_data,
+                custom_instruction=instruction
+            )
+
+        if cache_key is not None and decision:
+            self._decision_cache.put(self._agent_cache_name, cache_key, decision)
+
         return decision
     
     def _execute_decision(self, decision: Dict, price_map: Dict, timestamp: int) -> List[TradeEvent]:
@@ -403,6 +876,8 @@ class BacktestRunner:
                         cycle=self.cycle_count,
                         position_after=self._remaining_position(symbol, 'long')
                     ))
+                    self._close_pnl.append(realized)
+                    self._close_sym_id.append(self._symbol_idx.get(symbol, 0))
         
         elif action == 'close_short':
             qty = self._determine_close_quantity(symbol, 'short', decision)
@@ -427,6 +902,8 @@ class BacktestRunner:
                         cycle=self.cycle_count,
                         position_after=self._remaining_position(symbol, 'short')
                     ))
+                    self._close_pnl.append(realized)
+                    self._close_sym_id.append(self._symbol_idx.get(symbol, 0))
         
         return trades
     
@@ -452,75 +929,103 @@ class BacktestRunner:
     
     def _determine_close_quantity(self, symbol: str, side: str, decision: Dict) -> float:
         """Determine how much of a position to close"""
-        key = f"{symbol}:{side}"
-        positions = {self.account._position_key(p.symbol, p.side): p 
-                    for p in self.account.get_positions()}
-        
-        if key not in positions:
+        pos = self.account.get_position(symbol, side)
+        if pos is None:
             return 0.0
-        
-        pos = positions[key]
-        
+
         # Check if decision specifies quantity
         close_pct = decision.get('close_pct', 1.0)  # Default: close 100%
-        
+
         return pos.quantity * close_pct
-    
+
     def _remaining_position(self, symbol: str, side: str) -> float:
         """Get remaining position after trade"""
-        key = f"{symbol}:{side}"
-        positions = {self.account._position_key(p.symbol, p.side): p 
-                    for p in self.account.get_positions()}
-        
-        if key in positions:
-            return positions[key].quantity
-        return 0.0
+        pos = self.account.get_position(symbol, side)
+        return pos.quantity if pos is not None else 0.0
     
     def _resolve_leverage(self, requested: int, symbol: str) -> int:
-        """Get leverage for a symbol"""
-        if 'BTC' in symbol:
-            return self.leverage_config.get('BTC', 5)
-        elif 'ETH' in symbol:
-            return self.leverage_config.get('ETH', 5)
-        else:
-            return self.leverage_config.get('default', 3)
+        """Get leverage for a symbol (precomputed table, see __init__)"""
+        lev = self._lev_cache.get(symbol)
+        if lev is not None:
+            return lev
+        return self.leverage_config.get('default', 3)
     
-    def _record_equity_point(self, timestamp: int, price_map: Dict, liquidated: bool = False):
-        """Record equity snapshot"""
-        equity, unrealized, _ = self.account.total_equity(price_map)
-        
-        # Update max/min equity
-        if equity > self.max_equity:
-            self.max_equity = equity
-        if equity < self.min_equity:
-            self.min_equity = equity
-        
-        # Calculate drawdown
-        if self.max_equity > 0:
-            drawdown = ((self.max_equity - equity) / self.max_equity) * 100
-            if drawdown > self.max_drawdown:
-                self.max_drawdown = drawdown
-        else:
-            drawdown = 0
-        
+    def _record_equity_point(self, timestamp: int, price_map: Dict, liquidated: bool = False,
+                             equity_snapshot: Optional[Tuple] = None):
+        """
+        Record equity snapshot. Kept minimal on the hot path: running
+        max/min and drawdown are backfilled vectorized at the end of the
+        run (_finalize_drawdown) instead of branching per cycle, and
+        run() passes its per-cycle total_equity tuple in.
+        """
+        if equity_snapshot is None:
+            equity_snapshot = self.account.total_equity(price_map)
+        equity, unrealized, _ = equity_snapshot
+
         pnl = equity - self.account.initial_balance
         pnl_pct = (pnl / self.account.initial_balance) * 100
-        
-        point = EquityPoint(
-            timestamp=timestamp,
-            equity=equity,
-            available=self.account.get_cash(),
-            pnl=pnl,
-            pnl_pct=pnl_pct,
-            drawdown_pct=drawdown,
-            cycle=self.cycle_count
-        )
-        
-        self.equity_history.append(point)
+
+        # One structured-array row; grown if a caller records outside a
+        # sized run. drawdown_pct is backfilled by _finalize_drawdown.
+        if self._eq_n == self.equity_arr.shape[0]:
+            grown = np.empty(max(16, self.equity_arr.shape[0] * 2), dtype=EQ_DTYPE)
+            grown[:self._eq_n] = self.equity_arr[:self._eq_n]
+            self.equity_arr = grown
+        self.equity_arr[self._eq_n] = (timestamp, equity, self.account.get_cash(),
+                                       pnl, pnl_pct, 0.0, self.cycle_count)
+        self._eq_n += 1
+        self._eq_history_cache = None
     
+    def _finalize_drawdown(self) -> None:
+        """
+        Backfill drawdown_pct on the recorded equity points and update
+        max/min equity + max drawdown from the numpy equity curve. Same
+        numbers as the old per-cycle branches (peak seeded with the
+        initial balance), computed as three array expressions.
+        """
+        n = self._eq_n
+        if n == 0:
+            return
+
+        eq = self.equity_arr['equity'][:n]
+        peaks = np.maximum(np.maximum.accumulate(eq), self.account.initial_balance)
+        safe_peaks = np.where(peaks > 0, peaks, 1.0)
+        dd_pct = np.where(peaks > 0, (peaks - eq) / safe_peaks * 100, 0.0)
+
+        self.max_equity = max(self.max_equity, float(eq.max()))
+        self.min_equity = min(self.min_equity, float(eq.min()))
+        self.max_drawdown = max(self.max_drawdown, float(dd_pct.max()))
+
+        self.equity_arr['drawdown_pct'][:n] = dd_pct
+        self._eq_history_cache = None
+
+    @property
+    def equity_history(self) -> List[EquityPoint]:
+        """
+        Equity curve as EquityPoint dataclasses, materialized lazily
+        from the structured array for display/backward compatibility.
+        Vectorized consumers should read equity_arr columns directly.
+        """
+        if self._eq_history_cache is None:
+            rows = self.equity_arr[:self._eq_n]
+            self._eq_history_cache = [
+                EquityPoint(
+                    timestamp=int(r['timestamp']),
+                    equity=float(r['equity']),
+                    available=float(r['available']),
+                    pnl=float(r['pnl']),
+                    pnl_pct=float(r['pnl_pct']),
+                    drawdown_pct=float(r['drawdown_pct']),
+                    cycle=int(r['cycle']),
+                )
+                for r in rows
+            ]
+        return self._eq_history_cache
+
     def _calculate_metrics(self) -> BacktestMetrics:
         """Calculate final performance metrics"""
-        final_equity = self.equity_history[-1].equity if self.equity_history else self.account.initial_balance
+        final_equity = (float(self.equity_arr['equity'][self._eq_n - 1])
+                        if self._eq_n else self.account.initial_balance)
         
         total_return_pct = ((final_equity - self.account.initial_balance) / 
                            self.account.initial_balance) * 100
@@ -542,46 +1047,36 @@ class BacktestRunner:
             avg_loss=trade_metrics['avg_loss'],
             best_symbol=trade_metrics['best_symbol'],
             worst_symbol=trade_metrics['worst_symbol'],
-            liquidated=any(e.equity <= 0 for e in self.equity_history)
+            liquidated=bool((self.equity_arr['equity'][:self._eq_n] <= 0).any())
         )
     
     def _calculate_sharpe(self) -> float:
         """Calculate Sharpe ratio from equity curve"""
-        if len(self.equity_history) < 2:
-            return 0.0
-        
-        returns = []
-        for i in range(1, len(self.equity_history)):
-            prev = self.equity_history[i-1].equity
-            curr = self.equity_history[i].equity
-            if prev > 0:
-                ret = (curr - prev) / prev
-                returns.append(ret)
-        
-        if not returns:
+        if self._eq_n < 2:
             return 0.0
-        
-        mean_return = sum(returns) / len(returns)
-        
-        if len(returns) < 2:
+
+        # One vectorized pass over the equity column instead of two
+        # Python loops over EquityPoint objects
+        eq = self.equity_arr['equity'][:self._eq_n]
+        prev = eq[:-1]
+        mask = prev > 0
+        returns = (eq[1:][mask] - prev[mask]) / prev[mask]
+
+        if returns.shape[0] < 2:
             return 0.0
-        
-        variance = sum((r - mean_return) ** 2 for r in returns) / (len(returns) - 1)
-        std_dev = variance ** 0.5
-        
+
+        std_dev = returns.std(ddof=1)
         if std_dev == 0:
             return 0.0
-        
+
         # Annualize (assuming daily returns for simplification)
-        sharpe = (mean_return / std_dev) * (365 ** 0.5)
-        
-        return sharpe
+        return float(returns.mean() / std_dev * np.sqrt(365))
     
     def _calculate_trade_metrics(self) -> Dict:
         """Calculate win rate, profit factor, etc."""
-        closing_trades = [t for t in self.trade_events if 'close' in t.action]
-        
-        if not closing_trades:
+        total_trades = len(self._close_pnl)
+
+        if total_trades == 0:
             return {
                 'total_trades': 0,
                 'win_rate': 0.0,
@@ -591,34 +1086,22 @@ class BacktestRunner:
                 'best_symbol': '',
                 'worst_symbol': ''
             }
-        
-        wins = [t for t in closing_trades if t.realized_pnl > 0]
-        losses = [t for t in closing_trades if t.realized_pnl < 0]
-        
-        total_trades = len(closing_trades)
-        win_count = len(wins)
-        loss_count = len(losses)
-        
-        win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0.0
-        
-        total_win = sum(t.realized_pnl for t in wins)
-        total_loss = abs(sum(t.realized_pnl for t in losses))
-        
+
+        pnl = np.fromiter(self._close_pnl, np.float64, count=total_trades)
+        sym_id = np.fromiter(self._close_sym_id, np.int32, count=total_trades)
+        total_win, total_loss, win_count, loss_count, per_symbol, per_count = \
+            _trade_stats_nb(pnl, sym_id, len(self.symbols))
+
+        win_rate = win_count / total_trades * 100
         profit_factor = (total_win / total_loss) if total_loss > 0 else (999 if total_win > 0 else 0)
-        
         avg_win = (total_win / win_count) if win_count > 0 else 0.0
         avg_loss = (total_loss / loss_count) if loss_count > 0 else 0.0
-        
-        # Per-symbol analysis
-        symbol_pnl = {}
-        for trade in closing_trades:
-            if trade.symbol not in symbol_pnl:
-                symbol_pnl[trade.symbol] = 0.0
-            symbol_pnl[trade.symbol] += trade.realized_pnl
-        
-        best_symbol = max(symbol_pnl.items(), key=lambda x: x[1])[0] if symbol_pnl else ''
-        worst_symbol = min(symbol_pnl.items(), key=lambda x: x[1])[0] if symbol_pnl else ''
-        
+
+        # Best/worst among symbols that actually closed trades
+        traded = per_count > 0
+        best_symbol = self.symbols[int(np.where(traded, per_symbol, -np.inf).argmax())]
+        worst_symbol = self.symbols[int(np.where(traded, per_symbol, np.inf).argmin())]
+
         return {
             'total_trades': total_trades,
             'win_rate': win_rate,
@@ -4,10 +4,14 @@ Demo: Run a backtest on your trading agent
 import os
 import sys
 from datetime import datetime, timedelta
+
+import pandas as pd
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path (skipped when already present)
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from trading_agent.agent import RealWorldTradingAgent
 from trading_agent.backtest_runner import BacktestRunner
@@ -16,8 +20,10 @@ from trading_agent.backtest_runner import BacktestRunner
 def run_backtest_demo():
     """Run a simple backtest on historical data"""
     
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables (once per process)
+    if not os.environ.get("_DOTENV_LOADED"):
+        load_dotenv()
+        os.environ["_DOTENV_LOADED"] = "1"
     
     print("Trading Agent Backtest Demo")
     print("=" * 60)
@@ -104,26 +110,38 @@ def run_backtest_demo():
     if metrics.worst_symbol:
         print(f"Worst Symbol:     {metrics.worst_symbol}")
     
+    # Format every trade timestamp in one vectorized pass (the minute
+    # form is just a slice of the second form, so one pass covers both
+    # this section and the results file below)
+    trade_times = (
+        pd.to_datetime([t.timestamp for t in trade_events], unit='s')
+        .strftime('%Y-%m-%d %H:%M:%S').to_numpy()
+        if trade_events else []
+    )
+
     # Show recent trades
     print(f"\nRecent Trades (last 10):")
-    for trade in trade_events[-10:]:
-        timestamp = datetime.fromtimestamp(trade.timestamp).strftime('%Y-%m-%d %H:%M')
+    for trade, trade_time in zip(trade_events[-10:], trade_times[-10:]):
         action_indicator = '[OPEN]' if 'open' in trade.action else '[CLOSE]'
         pnl_str = f"${trade.realized_pnl:+.2f}" if trade.realized_pnl != 0 else ""
-        
-        print(f"   {action_indicator} {timestamp} | {trade.symbol:8} | {trade.action:12} | "
+
+        print(f"   {action_indicator} {trade_time[:16]} | {trade.symbol:8} | {trade.action:12} | "
               f"{trade.quantity:.4f} @ ${trade.price:.2f} | {pnl_str}")
-    
+
     # Show equity curve samples
     print(f"\nEquity Curve (samples):")
     sample_interval = max(1, len(equity_history) // 10)
-    for i in range(0, len(equity_history), sample_interval):
+    sample_idx = range(0, len(equity_history), sample_interval)
+    sample_times = (
+        pd.to_datetime([equity_history[i].timestamp for i in sample_idx], unit='s')
+        .strftime('%Y-%m-%d %H:%M').to_numpy()
+    )
+    for i, sample_time in zip(sample_idx, sample_times):
         point = equity_history[i]
-        timestamp = datetime.fromtimestamp(point.timestamp).strftime('%Y-%m-%d %H:%M')
         equity_change = point.pnl_pct
         direction = '[UP]' if equity_change >= 0 else '[DOWN]'
-        
-        print(f"   {direction} {timestamp} | Equity: ${point.equity:7.2f} | "
+
+        print(f"   {direction} {sample_time} | Equity: ${point.equity:7.2f} | "
               f"PnL: {equity_change:+6.2f}% | DD: {point.drawdown_pct:5.2f}%")
     print("\n" + "=" * 60)
     print("Backtest Complete!")
@@ -145,11 +163,16 @@ def run_backtest_demo():
         
         f.write("TRADE HISTORY:\n")
         f.write("-" * 60 + "\n")
-        for trade in trade_events:
-            timestamp = datetime.fromtimestamp(trade.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-            f.write(f"{timestamp} | {trade.symbol} | {trade.action} | "
-                   f"{trade.quantity:.4f} @ ${trade.price:.2f} | "
-                   f"PnL: ${trade.realized_pnl:+.2f}\n")
+        # Build the whole history in memory and flush it as one write
+        # instead of one syscall per trade
+        lines = [
+            f"{trade_time} | {trade.symbol} | {trade.action} | "
+            f"{trade.quantity:.4f} @ ${trade.price:.2f} | "
+            f"PnL: ${trade.realized_pnl:+.2f}"
+            for trade, trade_time in zip(trade_events, trade_times)
+        ]
+        if lines:
+            f.write('\n'.join(lines) + '\n')
     
     print(f"\nResults saved to: {output_file}")
 
@@ -5,16 +5,24 @@ Demo: Using Custom Instructions with Trading Agent
 This shows how to provide your own prompts/instructions to the AI trading agent.
 """
 
+import asyncio
 import os
 import sys
 from dotenv import load_dotenv
 
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+# Add parent directories to path (membership-checked so repeated
+# imports don't grow sys.path; it can't move under __main__ because the
+# package import below depends on it)
+_REPO_ROOT = os.path.join(os.path.dirname(__file__), '../../..')
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from white_agent.trading_agent import RealWorldTradingAgent
 
-load_dotenv()
+# One .env parse per process, shared with the other scripts
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 def demo_custom_instructions():
@@ -33,58 +41,74 @@ def demo_custom_instructions():
     print("Trading Agent with Custom Instructions")
     print("=" * 80)
     
+    # Each example is one LLM round-trip (seconds) and they are
+    # independent of each other, so dispatch all five at once and
+    # collect the results in order: total wall-clock is the slowest
+    # call, not the sum of all five
+    example_kwargs = [
+        dict(symbols=["BTCUSDT", "ETHUSDT"]),
+        dict(
+            symbols=["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+            custom_instruction="Only consider trading Bitcoin (BTCUSDT). Ignore other coins."
+        ),
+        dict(
+            custom_instruction="Close all open positions immediately. Do not open new positions."
+        ),
+        dict(
+            custom_instruction="""
+        Be extremely conservative:
+        - Never use more than 2x leverage
+        - Only trade if you have very high confidence (80%+)
+        - Position size should not exceed 1% of account
+        - Prefer holding to trading
+        """
+        ),
+        dict(
+            symbols=["BTCUSDT"],
+            custom_instruction="""
+        Strategy: Buy the dip
+        - Only open long if BTC is down more than 3% in 24h
+        - Use 3x leverage
+        - Position size: $200
+        - If no dip, then hold
+        """
+        ),
+    ]
+
+    async def run_examples():
+        return await asyncio.gather(*(
+            asyncio.to_thread(agent.run_cycle, **kwargs)
+            for kwargs in example_kwargs
+        ))
+
+    print("\n[RUN] Dispatching all 5 examples concurrently...")
+    result1, result2, result3, result4, result5 = asyncio.run(run_examples())
+
     # Example 1: No custom instruction (autonomous mode)
     print("\n[Example 1] Autonomous Mode (no custom instruction)")
     print("-" * 80)
-    result1 = agent.run_cycle(symbols=["BTCUSDT", "ETHUSDT"])
     print(f"Decision: {result1['decision']['action']}")
     print(f"Reasoning: {result1['decision']['reasoning'][:150]}...")
-    
+
     # Example 2: Custom instruction - Focus on specific coin
     print("\n\n[Example 2] Custom Instruction: Focus on BTC only")
     print("-" * 80)
-    result2 = agent.run_cycle(
-        symbols=["BTCUSDT", "ETHUSDT", "SOLUSDT"],
-        custom_instruction="Only consider trading Bitcoin (BTCUSDT). Ignore other coins."
-    )
     print(f"Decision: {result2['decision']['action']}")
     print(f"Symbol: {result2['decision'].get('symbol', 'N/A')}")
-    
+
     # Example 3: Custom instruction - Close all positions
     print("\n\n[Example 3] Custom Instruction: Close all positions")
     print("-" * 80)
-    result3 = agent.run_cycle(
-        custom_instruction="Close all open positions immediately. Do not open new positions."
-    )
     print(f"Decision: {result3['decision']['action']}")
-    
+
     # Example 4: Custom instruction - Conservative trading
     print("\n\n[Example 4] Custom Instruction: Conservative risk management")
     print("-" * 80)
-    result4 = agent.run_cycle(
-        custom_instruction="""
-        Be extremely conservative:
-        - Never use more than 2x leverage
-        - Only trade if you have very high confidence (80%+)
-        - Position size should not exceed 1% of account
-        - Prefer holding to trading
-        """
-    )
     print(f"Decision: {result4['decision']['action']}")
-    
+
     # Example 5: Custom instruction - Specific strategy
     print("\n\n[Example 5] Custom Instruction: Specific trading strategy")
     print("-" * 80)
-    result5 = agent.run_cycle(
-        symbols=["BTCUSDT"],
-        custom_instruction="""
-        Strategy: Buy the dip
-        - Only open long if BTC is down more than 3% in 24h
-        - Use 3x leverage
-        - Position size: $200
-        - If no dip, then hold
-        """
-    )
     print(f"Decision: {result5['decision']['action']}")
     if result5['decision'].get('symbol'):
         print(f"Symbol: {result5['decision']['symbol']}")
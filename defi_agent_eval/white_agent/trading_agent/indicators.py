@@ -0,0 +1,69 @@
+"""
+Indicator Kernels
+
+Small numeric kernels (SMA, EMA, RSI) used by the trading agent. Written
+as tight scalar loops so numba can JIT-compile them to native code when
+it is installed; without numba they run as plain Python over the same
+NumPy arrays, which is still fast enough for 24-candle windows.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def sma(values: np.ndarray, window: int) -> float:
+    """Mean of the last `window` values (clamped to the array length)"""
+    n = values.shape[0]
+    if n == 0:
+        return 0.0
+    if window > n:
+        window = n
+    total = 0.0
+    for i in range(n - window, n):
+        total += values[i]
+    return total / window
+
+
+@njit(cache=True, fastmath=True)
+def ema(values: np.ndarray, window: int) -> float:
+    """Exponential moving average over the whole array"""
+    n = values.shape[0]
+    if n == 0:
+        return 0.0
+    alpha = 2.0 / (window + 1.0)
+    acc = float(values[0])
+    for i in range(1, n):
+        acc = alpha * values[i] + (1.0 - alpha) * acc
+    return acc
+
+
+@njit(cache=True, fastmath=True)
+def rsi(values: np.ndarray, period: int = 14) -> float:
+    """Relative Strength Index over the trailing `period` deltas"""
+    n = values.shape[0]
+    if n < period + 1:
+        return 50.0
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        delta = values[i] - values[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    if loss == 0.0:
+        return 100.0
+    rs = gain / loss
+    return 100.0 - 100.0 / (1.0 + rs)